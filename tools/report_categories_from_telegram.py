@@ -6,7 +6,7 @@ Usage:
 import argparse
 import json
 from telethon.sync import TelegramClient
-from telegram_checker.config.api import API_ID, API_HASH
+from telegram_checker.config.api import load_api_credentials
 from telegram_checker.telegram_utils.report import get_categories_from_telegram
 
 
@@ -18,7 +18,7 @@ def main():
     parser.add_argument('--out',        default=None,   help='Optional JSON output file')
     args = parser.parse_args()
 
-    with TelegramClient(f'.secret/{args.user}.session', API_ID, API_HASH) as client:
+    with TelegramClient(f'.secret/{args.user}.session', *load_api_credentials()) as client:
         peer = client.get_entity(args.peer)
         tree = get_categories_from_telegram(client, peer, args.message_id)
 
@@ -2,14 +2,23 @@ import argparse
 from pathlib import Path
 from telegram_checker.config.constants import EMOJI
 from telegram_checker.config.constants import REGEX_INVITE_LINK_RAW, REGEX_USERNAME_RAW, REGEX_INVITE_HASH
+from telegram_checker.config.api import CONCURRENT_CHECKS
 from telegram_checker.commands.exceptions import ValidationException, CanceledByUser
 from telegram_checker.utils.logger import get_logger
-from pyperclip import paste
+from telegram_checker.utils.helpers import parse_time_expression
 
 LOG = get_logger()
 FROM_CLIPBOARD = "__from_clipboard__"
 
 
+def time_expression(value):
+    """argparse type of time arguments: parse_time_expression(), with argparse's usage error on invalid input"""
+    try:
+        return parse_time_expression(value)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
+
+
 def build_arg_parser():
     parser = argparse.ArgumentParser(
         description='Check Telegram entities status and update markdown files',
@@ -22,6 +31,13 @@ def build_arg_parser():
         default='default',
         help='User session name (default: default). Session stored in .secret/<user>.session'
     )
+    parser.add_argument(
+        '--pool',
+        nargs='+',
+        metavar='USER',
+        default=[],
+        help='Other user sessions checking entities along with --user (full check only)'
+    )
     parser.add_argument(
         '--path',
         help='Path to directory containing .md files'
@@ -33,7 +49,7 @@ def build_arg_parser():
     )
     parser.add_argument(
         '--skip-time',
-        type=str,
+        type=time_expression,
         metavar='SECONDS',
         help='Skip entities checked within this many seconds (e.g., 86400 or "24*60*60" for 1 day)'
     )
@@ -43,6 +59,18 @@ def build_arg_parser():
         metavar='STATUS',
         help='Skip entities with these last statuses (e.g., unknown banned)'
     )
+    parser.add_argument(
+        '--concurrency',
+        type=int,
+        default=CONCURRENT_CHECKS,
+        metavar='N',
+        help=f'Number of entities checked at the same time, at least one per account (default: {CONCURRENT_CHECKS})'
+    )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Check every entity on Telegram, without reading back cached results (they are still saved)'
+    )
     parser.add_argument(
         '--dry-run',
         action='store_true',
@@ -323,12 +351,13 @@ def validate_args(args):
             args.type = ["group", "channel", "bot"]
         if not args.skip_time:
             print(f"{EMOJI['warning']} --mass-report will, by default, use --skip-time 48*60*60 (48 h).")
-            args.skip_time = "48*60*60"
+            args.skip_time = 48*60*60
 
 
     # Validate --get-info options
     if args.get_info:
         if args.get_info == FROM_CLIPBOARD and args.from_clipboard:
+            from pyperclip import paste
             get_info = paste().strip()
             args.no_exit = True
             if not get_info:
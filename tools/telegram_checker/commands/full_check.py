@@ -1,10 +1,20 @@
+import json
+import asyncio
 from inspect import currentframe
-from time import sleep
-from telegram_checker.config.constants import EMOJI, make_stats
-from telegram_checker.config.api import SLEEP_BETWEEN_CHECKS
-from telegram_checker.telegram_utils.entity_fetcher import iter_md_entities
+from pathlib import Path
+from telegram_checker.config.constants import (
+    EMOJI,
+    EMOJI_CHANGE,
+    EMOJI_ERROR,
+    EMOJI_HANDLE,
+    EMOJI_NO_EMOJI,
+    EMOJI_SKIP,
+    RESULTS_FILE,
+    make_stats
+)
+from telegram_checker.config.api import ID_BATCH_SIZE
+from telegram_checker.telegram_utils.entity_fetcher import iter_md_entities_deferred
 from telegram_checker.utils.helpers import get_date_time, print_debug
-from telegram_checker.mdml_utils.mdml_file import write_id_to_md
 from telegram_checker.mdml_utils.mdml_file import process_and_update_file
 from telegram_checker.utils.output_display import (
     print_stats,
@@ -14,117 +24,224 @@ from telegram_checker.utils.output_display import (
     print_discovered_usernames,
     print_status_changed_files
 )
-from telegram_checker.telegram_utils.status_checker import check_entity_with_fallback
+from telegram_checker.telegram_utils.status_checker import check_entity_with_pool, batch_resolve_ids
+from telegram_checker.telegram_utils.client import run_async, SkipOnInterrupt
+from telegram_checker.telegram_utils.entity_cache import init_entity_cache
 from telegram_checker.utils.logger import get_logger, create_progress_bar
 
 LOG = get_logger()
 
 
-def full_check(client, args, ignore_statuses, md_files, skip_time_seconds):
+def full_check(connect_pool, args, ignore_statuses, md_files, skip_time_seconds):
+    """
+    Checks every entity passing the filters, and updates their files.
+
+    Args:
+        connect_pool (callable): Returns the connected ClientPool. Only called once an entity
+                                 passes the filters: a run skipping every file never connects to Telegram.
+    """
+    ignore_statuses = frozenset(ignore_statuses or ())
     # Statistics
     stats = make_stats('check')
-    # Store results for dry-run summary
-    results = []
+    # Results for the dry-run summary are streamed to a file, not kept in memory
+    results_path = Path(RESULTS_FILE)
+    results_file = None
+    if args.dry_run:
+        results_path.parent.mkdir(exist_ok=True)
+        results_file = results_path.open('w', encoding='utf-8')
     status_changed_files = []
     no_status_block_results = []
     recovered_ids = []  # List of {file, id, method, written}
     discovered_usernames = []  # List of {file, old_username, new_username, status}
 
+    # Results younger than --skip-time, and those of this run, are read back from the cache (unless --no-cache)
+    cache = init_entity_cache(ttl=skip_time_seconds, enabled=not args.no_cache)
+
     progress_bar = create_progress_bar(LOG, md_files, "Checking")
     progress_bar['bar'].start()
 
-    try:
-        for item in iter_md_entities(args, md_files, stats, skip_time_seconds, progress_bar=progress_bar):
-            md_file          = item['md_file']
-            entity           = item['entity']
-            expected_id      = item['expected_id']
-            identifiers      = item['identifiers']
-            is_invite        = item['is_invite']
-            last_status      = item['last_status']
-            has_status_block = item['has_status_block']
+    async def check_item(item, resolved):
+        md_file          = item['md_file']
+        entity           = item['entity']
+        expected_id      = item['expected_id']
+        identifiers      = item['identifiers']
+        is_invite        = item['is_invite']
+        last_status      = item['last_status']
+        has_status_block = item['has_status_block']
 
-            try:
-                (
-                    status,
-                    restriction_details,
-                    actual_id,
-                    actual_username,
-                    method_used,
-                    display_id
-                ) = check_entity_with_fallback(client, expected_id, identifiers, is_invite, stats)
-
-                if actual_id and not expected_id:
-                    id_written = False
-                    if method_used == 'invite' and args.write_id and not args.dry_run:
-                        if write_id_to_md(md_file, actual_id):
-                            LOG.info(f"  {EMOJI['saved']} ID written to file: `{actual_id}`")
-                            id_written = True
-                        else:
-                            LOG.info(f"  {EMOJI['info']} ID already present in file.")
-                    recovered_ids.append({
-                        'file': md_file.name, 'id': actual_id,
-                        'method': method_used, 'written': id_written
+        try:
+            (
+                status,
+                restriction_details,
+                actual_id,
+                actual_username,
+                method_used,
+                display_id,
+                checked_at
+            ) = await check_entity_with_pool(pool, expected_id, identifiers, is_invite, stats, resolved)
+
+            # A recovered ID is written along with the status (see process_and_update_file())
+            new_id = None
+            if actual_id and not expected_id and method_used == 'invite' and args.write_id:
+                new_id = actual_id
+
+            if actual_username:
+                username = entity.get_username(allow_strikethrough=False)
+                existing_username = username.value if username else None
+                if not existing_username:
+                    LOG.info(f"  {EMOJI_HANDLE} Username discovered: @{actual_username}")
+                    discovered_usernames.append({
+                        'file': md_file.name, 'old_username': None,
+                        'new_username': actual_username, 'status': 'discovered'
                     })
+                elif existing_username.lower() != actual_username.lower():
+                    LOG.info(f"  {EMOJI_CHANGE} Username changed: @{existing_username} → @{actual_username}")
+                    discovered_usernames.append({
+                        'file': md_file.name, 'old_username': existing_username,
+                        'new_username': actual_username, 'status': 'changed'
+                    })
+
+            stats['total'] += 1
+            # 'error_<ExceptionName>' statuses are all counted as errors
+            stats['error' if status.startswith('error_') else status] += 1
+
+            should_ignore = status in ignore_statuses
+            if should_ignore:
+                stats['ignored'] += 1
+
+            # File I/O runs in a thread, so that other checks keep going meanwhile
+            should_track_change, was_updated, id_written = await asyncio.to_thread(
+                process_and_update_file,
+                md_file, status, restriction_details, actual_id,
+                expected_id, last_status, should_ignore, args.dry_run, new_id, checked_at
+            )
+            if actual_id and not expected_id:
+                recovered_ids.append({
+                    'file': md_file.name, 'id': actual_id,
+                    'method': method_used, 'written': id_written
+                })
+            # A new status written to the file will be confirmed by Telegram next time
+            if should_track_change and was_updated:
+                cache.invalidate(expected_id, identifiers, is_invite)
+
+            result = {
+                'file': md_file.name, 'identifier': display_id,
+                'status': status, 'timestamp': checked_at or get_date_time(),
+                'emoji': EMOJI.get(status, EMOJI_NO_EMOJI),
+                'restriction_details': restriction_details
+            }
+            if results_file:
+                # Written from the event loop only: lines are never interleaved
+                results_file.write(json.dumps(result, ensure_ascii=False) + '\n')
+
+            # Only what the final summaries print is kept in memory (and only for the files concerned)
+            if not has_status_block:
+                no_status_block_results.append({'file': result['file'], 'status': status, 'emoji': result['emoji']})
+            if should_track_change:
+                status_changed_files.append({'file': md_file.name, 'old': last_status, 'new': status})
+
+        except Exception as e:
+            LOG.error("Error processing entity.", EMOJI_ERROR)
+            print_debug(e, currentframe().f_code.co_name)
+
+    pool = None
+    # Files are read ahead of their checks, in a thread: their output and stats are taken once their turn comes (see show_file())
+    files = iter_md_entities_deferred(args, md_files, skip_time_seconds)
+
+    def read_window():
+        # Files up to the next ID_BATCH_SIZE entities to check, skipped files included
+        window = []
+        to_check = 0
+        for md_file, item, log, file_stats in files:
+            window.append((md_file, item, log, file_stats))
+            if item:
+                to_check += 1
+                if to_check == ID_BATCH_SIZE:
+                    break
+        return window
+
+    def show_file(md_file, log, file_stats):
+        # Header and skip messages of the file, just before its check (from the event loop only)
+        progress_bar['bar'].update(progress_bar['task'], entity=md_file.stem)
+        log.replay(LOG)
+        for key, count in file_stats.items():
+            stats[key] += count
+
+    async def run_checks(window):
+        # Pipeline: a new check starts as soon as a slot is free, the rate being set by the
+        # accounts' rate limiters. Every account of the pool gets at least one slot.
+        semaphore = asyncio.Semaphore(max(1, args.concurrency, len(pool)))
+
+        async def worker(item, resolved):
+            try:
+                # Skipped by the user on CTRL+C: the other checks go on
+                if await skipper.run(check_item(item, resolved)):
+                    stats['skipped'] += 1
+                    stats['skipped_user'] += 1
+            finally:
+                semaphore.release()
+                progress_bar['bar'].advance(progress_bar['task'])
+
+        # Files are read and parsed in a thread, one window ahead, while the checks of the current window go on
+        next_window = None
+        try:
+            # On a second CTRL+C, the task group cancels the running checks
+            async with asyncio.TaskGroup() as task_group:
+                while window:
+                    next_window = asyncio.create_task(asyncio.to_thread(read_window))
+
+                    # Known IDs of the window are fetched in a few calls, instead of one per entity
+                    resolved = {}
+                    ids = [item['expected_id'] for _, item, _, _ in window if item and item['expected_id']]
+                    if ids:
+                        async with pool.with_client() as client:
+                            resolved = await batch_resolve_ids(client, ids)
+                        LOG.debug(f"{len(resolved)}/{len(ids)} IDs resolved by batch")
+
+                    for md_file, item, log, file_stats in window:
+                        # Skipped files wait for a slot too, so that their output follows the checks before them
+                        await semaphore.acquire()
+                        show_file(md_file, log, file_stats)
+                        if item is None:
+                            semaphore.release()
+                            progress_bar['bar'].advance(progress_bar['task'])
+                            continue
+                        task_group.create_task(worker(item, resolved))
+
+                    window = await next_window
+        finally:
+            if next_window:
+                next_window.cancel()
+
+    try:
+        # The first window is read before connecting: nothing to check, no connection
+        first_window = read_window()
+        if any(item for _, item, _, _ in first_window):
+            # Paused while connecting, in case Telegram asks for a login code
+            progress_bar['bar'].stop()
+            pool = connect_pool()
+            progress_bar['bar'].start()
+            # Output is written by a background thread, so that the checks never wait for the console
+            LOG.start_writer()
+            # First CTRL+C: the checks in progress are skipped. Second one: the run is interrupted
+            with SkipOnInterrupt(pool.clients[0].loop) as skipper:
+                run_async(pool.clients[0], run_checks(first_window))
+        else:
+            for md_file, _, log, file_stats in first_window:
+                show_file(md_file, log, file_stats)
+                progress_bar['bar'].advance(progress_bar['task'])
+            LOG.info("Nothing to check: not connecting to Telegram.", emoji=EMOJI_SKIP)
 
-                if actual_username:
-                    username = entity.get_username(allow_strikethrough=False)
-                    existing_username = username.value if username else None
-                    if not existing_username:
-                        LOG.info(f"  {EMOJI['handle']} Username discovered: @{actual_username}")
-                        discovered_usernames.append({
-                            'file': md_file.name, 'old_username': None,
-                            'new_username': actual_username, 'status': 'discovered'
-                        })
-                    elif existing_username.lower() != actual_username.lower():
-                        LOG.info(f"  {EMOJI['change']} Username changed: @{existing_username} → @{actual_username}")
-                        discovered_usernames.append({
-                            'file': md_file.name, 'old_username': existing_username,
-                            'new_username': actual_username, 'status': 'changed'
-                        })
-
-                stats['total'] += 1
-                stats[status] = stats.get(status, 0) + 1
-
-                should_ignore = ignore_statuses and status in ignore_statuses
-                if should_ignore:
-                    stats['ignored'] += 1
-
-                should_track_change, _ = process_and_update_file(
-                    md_file, status, restriction_details, actual_id,
-                    expected_id, last_status, should_ignore, args.dry_run
-                )
-
-                result = {
-                    'file': md_file.name, 'identifier': display_id,
-                    'status': status, 'timestamp': get_date_time(),
-                    'emoji': EMOJI.get(status, EMOJI["no_emoji"]),
-                    'restriction_details': restriction_details
-                }
-                results.append(result)
-
-                if not has_status_block:
-                    no_status_block_results.append(result)
-                if should_track_change:
-                    status_changed_files.append({'file': md_file.name, 'old': last_status, 'new': status})
-
-                if md_file != md_files[-1]:
-                    sleep(SLEEP_BETWEEN_CHECKS)
-
-            except Exception as e:
-                LOG.error("Error processing entity.", EMOJI['error'])
-                print_debug(e, currentframe().f_code.co_name)
-
-            except KeyboardInterrupt:
-                stats['skipped'] += 1
-                stats['skipped_user'] += 1
-                LOG.info('CTRL+C detected. Entity skipped by user. Press CTRL+C again to quit.', emoji=EMOJI['skip'])
-                try:
-                    sleep(2)
-                except KeyboardInterrupt:
-                    raise
-                continue
+    except KeyboardInterrupt:
+        LOG.info('CTRL+C detected. Check interrupted by user.', emoji=EMOJI_SKIP)
 
     finally:
+        LOG.stop_writer()
+        if pool:
+            pool.disconnect()
+        cache.close()
+        if results_file:
+            results_file.close()
         progress_bar['bar'].stop()
         LOG.set_progress(None)
         # Final statistics
@@ -132,7 +249,7 @@ def full_check(client, args, ignore_statuses, md_files, skip_time_seconds):
         print_stats(stats)
         # Dry-run summary
         if args.dry_run:
-            print_dry_run_summary(results)
+            print_dry_run_summary(results_path)
         if status_changed_files:
             print_status_changed_files(status_changed_files)
         if no_status_block_results:
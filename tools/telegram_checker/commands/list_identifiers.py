@@ -1,3 +1,5 @@
+import asyncio
+from dataclasses import dataclass
 from inspect import currentframe
 from time import sleep
 from telegram_checker.telegram_utils.entity_actions import join_entity, add_contact
@@ -5,17 +7,19 @@ from telegram_checker.telegram_utils.exceptions import TelegramUtilsActionAddCon
 from telegram_checker.utils.exceptions import DebugException
 from telegram_checker.utils.logger import get_logger, create_progress_bar
 from telegram_checker.config.constants import EMOJI, UI_HORIZONTAL_LINE
-from telegram_checker.config.api import SLEEP_BETWEEN_CHECKS
-from telegram_mdml.telegram_mdml import TelegramEntity
 from telegram_mdml.telegram_mdml import (
     MissingFieldError,
     InvalidTypeError
 )
-from telegram_checker.mdml_utils.mdml_parser import get_last_status
+from telegram_checker.mdml_utils.mdml_parser import get_last_status, iter_scan_md_fast, load_entity
 from telegram_checker.telegram_utils.validators import validate_invite, validate_handle
+from telegram_checker.telegram_utils.client import run_async, SkipOnInterrupt
+from telegram_checker.telegram_utils.rate_limiter import get_rate_limiter
 from telegram_checker.utils.helpers import print_debug
 
 LOG = get_logger()
+# Statuses not listed, unless --no-skip
+LIST_SKIPPED_STATUSES = ('banned', 'unknown', 'deleted')
 # Bins: (label, min_exclusive, max_inclusive)
 # None as max_inclusive means +inf
 SIZE_BINS = [
@@ -30,6 +34,24 @@ SIZE_BINS = [
 ]
 
 
+@dataclass(slots=True)
+class IdentifierEntry:
+    file: str
+    short: str  # invite hash, or @username
+    is_invite: bool
+    entity_type: str = None
+    member_count: int = None
+    # Set once validated, in 'valid' mode
+    valid: bool = None
+    user_id: int = None
+    reason: str = None
+    message: str = "Not validated"
+
+    @property
+    def full_link(self):
+        return f'https://t.me/+{self.short}' if self.is_invite else f'https://t.me/{self.short[1:]}'
+
+
 def get_size_bin_label(size):
     """Return the bin label for a given member count. Returns None if count is None."""
     if size is None:
@@ -48,12 +70,12 @@ def print_identifiers(identifiers_list, md_tasks=False, active_only=False, clean
 
     bin_length_digits = 0
     if numbered:
-        valid_count = sum(1 for i in identifiers_list if i['valid'] is True)
+        valid_count = sum(1 for i in identifiers_list if i.valid is True)
         bin_length_digits = len(str(valid_count))
 
     max_member_count_digits = 0
     if show_size:
-        sizes = [i['member_count'] for i in identifiers_list if i['member_count'] is not None]
+        sizes = [i.member_count for i in identifiers_list if i.member_count is not None]
         max_member_count_digits = len(str(max(sizes))) if sizes else 0
 
     def build_prefix(n_val, size_val):
@@ -72,32 +94,41 @@ def print_identifiers(identifiers_list, md_tasks=False, active_only=False, clean
         else:
             return f"{block} " if block else ""
 
+    # Emojis bound once, and lines written in a single call
+    emoji_invite, emoji_handle, emoji_active = EMOJI['invite'], EMOJI['handle'], EMOJI['active']
+    emoji_id, emoji_file, emoji_text, emoji_none = EMOJI['id'], EMOJI['file'], EMOJI['text'], EMOJI['no_emoji']
+    lines = []
+
     for ident in identifiers_list:
-        type_indicator = EMOJI['invite'] if "+" in ident['full_link'] else EMOJI['handle']
+        type_indicator = emoji_invite if ident.is_invite else emoji_handle
+        full_link = ident.full_link
 
-        if ident['valid'] is True:
+        if ident.valid is True:
             n += 1
-            prefix = build_prefix(n_val=n, size_val=ident['member_count'])
-            state = f"{EMOJI['active']} " if not active_only else ""
-            dest(f"{prefix}{state}{type_indicator} {ident['full_link']}")
+            prefix = build_prefix(n_val=n, size_val=ident.member_count)
+            state = f"{emoji_active} " if not active_only else ""
+            lines.append(f"{prefix}{state}{type_indicator} {full_link}")
             if not clean:
-                if ident['user_id']:
-                    dest(f"  {EMOJI['id']      } {ident['user_id']}")
-                dest(f"  {EMOJI['file']    } \\[[{ident['file']}\\]]")
+                if ident.user_id:
+                    lines.append(f"  {emoji_id} {ident.user_id}")
+                lines.append(f"  {emoji_file} \\[[{ident.file}\\]]")
 
-        elif ident['valid'] is False and not active_only:
-            prefix = build_prefix(n_val=0, size_val=ident['member_count'])
-            dest(f"{prefix}{EMOJI['no_emoji']} {type_indicator} {ident['full_link']}")
+        elif ident.valid is False and not active_only:
+            prefix = build_prefix(n_val=0, size_val=ident.member_count)
+            lines.append(f"{prefix}{emoji_none} {type_indicator} {full_link}")
             if not clean:
-                dest(f"  {EMOJI['file']    } \\[[{ident['file']}\\]]")
-                dest(f"  {EMOJI['text']    } \\[[{ident['reason']}\\]]")
-                dest(f"  {EMOJI['text']    } \\[[{ident['message']}\\]]")
+                lines.append(f"  {emoji_file} \\[[{ident.file}\\]]")
+                lines.append(f"  {emoji_text} \\[[{ident.reason}\\]]")
+                lines.append(f"  {emoji_text} \\[[{ident.message}\\]]")
 
-        elif ident['valid'] is None and not active_only:
-            prefix = build_prefix(n_val=0, size_val=ident['member_count'])
-            dest(f"{prefix}{type_indicator} {ident['full_link']}")
+        elif ident.valid is None and not active_only:
+            prefix = build_prefix(n_val=0, size_val=ident.member_count)
+            lines.append(f"{prefix}{type_indicator} {full_link}")
             if not clean:
-                dest(f"  {EMOJI['file']    } \\[[{ident['file']}\\]]")
+                lines.append(f"  {emoji_file} \\[[{ident.file}\\]]")
+
+    if lines:
+        dest("\n".join(lines))
 
 
 def print_identifiers_binned(identifiers_list, md_tasks=False, active_only=False, clean=False, tg_list=False):
@@ -106,15 +137,15 @@ def print_identifiers_binned(identifiers_list, md_tasks=False, active_only=False
         return
 
     # Separate users from channels/groups
-    users = [i for i in identifiers_list if i.get('entity_type') in ('user', 'bot')]
-    non_users = [i for i in identifiers_list if i.get('entity_type') not in ('user', 'bot')]
+    users = [i for i in identifiers_list if i.entity_type in ('user', 'bot')]
+    non_users = [i for i in identifiers_list if i.entity_type not in ('user', 'bot')]
 
     # Group non-users into bins
     binned = {label: [] for label, _, _ in SIZE_BINS}
     unknown_bin = []
 
     for ident in non_users:
-        label = get_size_bin_label(ident.get('member_count'))
+        label = get_size_bin_label(ident.member_count)
         if label is None:
             unknown_bin.append(ident)
         else:
@@ -122,7 +153,7 @@ def print_identifiers_binned(identifiers_list, md_tasks=False, active_only=False
 
     # Print each bin in order
     for label, _, _ in SIZE_BINS:
-        entries = sorted(binned[label], key=lambda i: i['member_count'], reverse=True)
+        entries = sorted(binned[label], key=lambda i: i.member_count, reverse=True)
         if not entries:
             continue
         LOG.output()
@@ -148,21 +179,80 @@ def print_identifiers_binned(identifiers_list, md_tasks=False, active_only=False
         LOG.output(UI_HORIZONTAL_LINE)
 
 
+async def validate_entries(client, entries, concurrency=1, on_validated=None, skipper=None):
+    """
+    Validates identifier entries (IdentifierEntry) in place, up to `concurrency` at a time.
+    An identifier listed in several files is validated once.
+    The pace is set by the client's rate limiter: invites cost twice as much as handles.
+
+    Args:
+        client: TelegramClient instance
+        entries (list): Invite and username entries
+        concurrency (int): Maximum number of validations at the same time
+        on_validated (callable): Called with each entry, once validated
+        skipper (SkipOnInterrupt): Lets the user skip the validations in progress with CTRL+C (left unvalidated)
+    """
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    limiter = get_rate_limiter(client)
+
+    by_identifier = {}
+    for entry in entries:
+        key = (entry.is_invite, entry.short if entry.is_invite else entry.short.lower())
+        by_identifier.setdefault(key, []).append(entry)
+
+    async def validate_same(same_entries):
+        entry = same_entries[0]
+        if entry.is_invite:
+            await limiter.acquire(cost=2)
+            result = await validate_invite(client, entry.short)
+        else:
+            await limiter.acquire()
+            result = await validate_handle(client, entry.short[1:])
+        limiter.on_success()
+        for entry in same_entries:
+            entry.valid, entry.user_id, entry.reason, entry.message = result
+            if on_validated:
+                on_validated(entry)
+
+    async def validate(same_entries):
+        try:
+            if skipper:
+                await skipper.run(validate_same(same_entries))
+            else:
+                await validate_same(same_entries)
+        finally:
+            semaphore.release()
+
+    async with asyncio.TaskGroup() as task_group:
+        for same_entries in by_identifier.values():
+            await semaphore.acquire()
+            task_group.create_task(validate(same_entries))
+
+
 def list_identifiers(client, md_files, args):
-    identifiers_list = []
+    listed = []  # (invite_entries, username_entries) of each listed entity, in file order
+
+    def print_entry(entry):
+        if args.continuous:
+            print_identifiers([entry], args.md, args.active_only, args.clean, args.tg_list, numbered=False)
+        else:
+            print_identifiers([entry], args.md, args.active_only, args.clean, args.tg_list, dest=LOG.info, numbered=False)
 
     progress_bar = create_progress_bar(LOG, md_files, 'Listing...')
     progress_bar['bar'].start()
 
-    for md_file in md_files:
+    # 1. List the identifiers of every entity
+    for md_file, scan in iter_scan_md_fast(md_files):
         progress_bar['bar'].update(progress_bar['task'], entity=md_file.stem)
         progress_bar['bar'].advance(progress_bar['task'])
 
-        invite_entry = None
-        username_entry = None
+        # Skip files with banned/unknown status unless --no-skip, before parsing them
+        if not args.no_skip and scan and scan.last_status in LIST_SKIPPED_STATUSES:
+            continue
+
         LOG.debug(f'Handling file {md_file.name}...')
         try:
-            entity = TelegramEntity.from_file(md_file)
+            entity = load_entity(md_file)
 
             # Skip files with type = 'user' or 'bot'
             entity_type = None
@@ -178,7 +268,7 @@ def list_identifiers(client, md_files, args):
             # Skip files with banned/unknown status unless --no-skip
             if not args.no_skip:
                 last_status, _, _ = get_last_status(entity)
-                if last_status in ['banned', 'unknown', 'deleted']:
+                if last_status in LIST_SKIPPED_STATUSES:
                     continue
 
             # Skip files if type is defined
@@ -195,99 +285,26 @@ def list_identifiers(client, md_files, args):
                     print_debug(DebugException(e))
 
             # Get invites
-            invites = entity.get_invites().active()
-
-            for invite in invites:
-                invite_entry = {
-                    'file': md_file.name,
-                    'short': invite.hash,
-                    'full_link': f'https://t.me/+{invite.hash}',
-                    'entity_type': entity_type,
-                    'member_count': size,
-                }
-
-                # Validate if in 'valid' mode
-                if args.get_identifiers == 'valid':
-                    (
-                        invite_entry['valid'],
-                        invite_entry['user_id'],
-                        invite_entry['reason'],
-                        invite_entry['message']
-                    ) = validate_invite(client, invite.hash)
-                    LOG.debug(f"Sleeping 2×{SLEEP_BETWEEN_CHECKS} seconds...", padding=2)
-                    sleep(2*SLEEP_BETWEEN_CHECKS)  # Rate limiting
-                else:
-                    # 'all' mode - no validation
-                    invite_entry['valid'] = None
-                    invite_entry['reason'] = None
-                    invite_entry['message'] = "Not validated"
-
-                if args.continuous:
-                    print_identifiers([invite_entry], args.md, args.active_only, args.clean, args.tg_list, numbered=False)
-                else:
-                    identifiers_list.append(invite_entry)
-                    print_identifiers([invite_entry], args.md, args.active_only, args.clean, args.tg_list, dest=LOG.info, numbered=False)
+            invite_entries = [
+                IdentifierEntry(md_file.name, invite.hash, True, entity_type, size)
+                for invite in entity.get_invites().active()
+            ]
 
             # Add usernames if not --invites-only
+            username_entries = []
             if not args.invites_only:
-                usernames = entity.get_usernames().active()
-                for username in usernames:
-                    username_entry = {
-                        'file': md_file.name,
-                        'short': '@' + username.value,
-                        'full_link': f'https://t.me/{username.value}',
-                        'entity_type': entity_type,
-                        'member_count': size,
-                    }
-
-                    # Validate if in 'valid' mode
-                    if args.get_identifiers == 'valid':
-                        (
-                            username_entry['valid'],
-                            username_entry['user_id'],
-                            username_entry['reason'],
-                            username_entry['message']
-                        ) = validate_handle(client, username.value)
-                        LOG.debug(f"Sleeping {SLEEP_BETWEEN_CHECKS} seconds...", padding=2)
-                        sleep(SLEEP_BETWEEN_CHECKS)
-                    else:
-                        username_entry['valid'] = None
-                        username_entry['reason'] = None
-                        username_entry['message'] = "Not validated"
-
-                    if args.continuous:
-                        print_identifiers([username_entry], args.md, args.active_only, args.clean, args.tg_list, numbered=False)
-                    else:
-                        identifiers_list.append(username_entry)
-                        print_identifiers([username_entry], args.md, args.active_only, args.clean, args.tg_list, dest=LOG.info, numbered=False)
-
-            # Try to join if --join
-            if args.join and ((username_entry and username_entry['valid']) or (invite_entry and invite_entry['valid'])):
-                LOG.info("Trying to join entity...", emoji=EMOJI['change'], padding=2)
-                LOG.debug(f"Sleeping {SLEEP_BETWEEN_CHECKS} seconds...", padding=2)
-                sleep(SLEEP_BETWEEN_CHECKS)
-                try:
-                    result = None
-                    # Try username first (less timeout)
-                    if username_entry and username_entry['valid']:
-                        if username_entry['entity_type'] in ["group", "channel"]:
-                            result = join_entity(client, username_entry['short'])
-                        elif username_entry['entity_type'] in ["user"]:
-                            result = add_contact(client, username_entry['short'])
-                        elif username_entry['entity_type'] in ["bot"]:
-                            LOG.info("Not adding a bot as a contact! Try interacting with /start", emoji=EMOJI['bot'], padding=4)
-                        else:
-                            print_debug(DebugException(f"Entity type {username_entry['entity_type']} not valid."), currentframe().f_code.co_name)
-                    elif invite_entry and invite_entry['valid']:
-                        result = join_entity(client, invite_entry['full_link'])
+                username_entries = [
+                    IdentifierEntry(md_file.name, '@' + username.value, False, entity_type, size)
+                    for username in entity.get_usernames().active()
+                ]
 
-                    if result:
-                        LOG.info(result.value[0], emoji=result.value[1], padding=4)
-
-                except (TelegramUtilsActionJoinEntityError, TelegramUtilsActionAddContactError):
-                    LOG.info("Action failed, skipping", emoji=EMOJI['error'], padding=4)
+            # Validated later, in 'valid' mode
+            if args.get_identifiers != 'valid':
+                for entry in invite_entries + username_entries:
+                    print_entry(entry)
+                LOG.info()
 
-            LOG.info()
+            listed.append((invite_entries, username_entries))
 
         except Exception as e:
             print_debug(e, currentframe().f_code.co_name)
@@ -303,8 +320,77 @@ def list_identifiers(client, md_files, args):
 
     progress_bar['bar'].stop()
 
+    # 2. Validate them all, several at a time (in 'valid' mode)
+    if args.get_identifiers == 'valid':
+        entries = [entry for invite_entries, username_entries in listed for entry in invite_entries + username_entries]
+        progress_bar = create_progress_bar(LOG, entries, 'Validating...')
+        progress_bar['bar'].start()
+
+        def on_validated(entry):
+            progress_bar['bar'].update(progress_bar['task'], entity=entry.short)
+            progress_bar['bar'].advance(progress_bar['task'])
+            print_entry(entry)
+
+        LOG.start_writer()
+        try:
+            with SkipOnInterrupt(client.loop) as skipper:
+                run_async(client, validate_entries(client, entries, args.concurrency, on_validated, skipper))
+        except KeyboardInterrupt:
+            LOG.info('CTRL+C detected. Validation interrupted by user.', emoji=EMOJI['skip'])
+        finally:
+            LOG.stop_writer()
+            progress_bar['bar'].stop()
+            LOG.set_progress(None)
+
+    # 3. Try to join if --join
+    if args.join:
+        for invite_entries, username_entries in listed:
+            invite_entry = invite_entries[-1] if invite_entries else None
+            username_entry = username_entries[-1] if username_entries else None
+            if not ((username_entry and username_entry.valid) or (invite_entry and invite_entry.valid)):
+                continue
+            try:
+                LOG.info("Trying to join entity...", emoji=EMOJI['change'], padding=2)
+                # Paced by the account's rate limiter (shared with the validation), no wait before the first join
+                run_async(client, get_rate_limiter(client).acquire())
+                try:
+                    result = None
+                    # Try username first (less timeout)
+                    if username_entry and username_entry.valid:
+                        if username_entry.entity_type in ["group", "channel"]:
+                            result = join_entity(client, username_entry.short)
+                        elif username_entry.entity_type in ["user"]:
+                            result = add_contact(client, username_entry.short)
+                        elif username_entry.entity_type in ["bot"]:
+                            LOG.info("Not adding a bot as a contact! Try interacting with /start", emoji=EMOJI['bot'], padding=4)
+                        else:
+                            print_debug(DebugException(f"Entity type {username_entry.entity_type} not valid."), currentframe().f_code.co_name)
+                    elif invite_entry and invite_entry.valid:
+                        result = join_entity(client, invite_entry.full_link)
+
+                    if result:
+                        LOG.info(result.value[0], emoji=result.value[1], padding=4)
+
+                except (TelegramUtilsActionJoinEntityError, TelegramUtilsActionAddContactError):
+                    LOG.info("Action failed, skipping", emoji=EMOJI['error'], padding=4)
+
+                LOG.info()
+
+            except Exception as e:
+                print_debug(e, currentframe().f_code.co_name)
+                continue
+
+            except KeyboardInterrupt:
+                LOG.info('CTRL+C detected. Entity skipped by user. Press CTRL+C again to quit.', emoji=EMOJI['skip'])
+                try:
+                    sleep(2)
+                except KeyboardInterrupt:
+                    raise
+                continue
+
     # Print results and cleanup
     if not args.continuous:
+        identifiers_list = [entry for invite_entries, username_entries in listed for entry in invite_entries + username_entries]
         LOG.output(UI_HORIZONTAL_LINE)
         LOG.throttle = False
         if args.sort_size:
@@ -11,7 +11,7 @@ from statistics import mean
 from collections import Counter
 from inspect import currentframe
 from datetime import datetime
-from time import time, sleep
+from time import time, sleep, monotonic
 from telethon.errors import FloodWaitError
 from telethon.tl.functions.messages import CheckChatInviteRequest
 from telegram_checker.config.api import SLEEP_BETWEEN_REPORTS
@@ -46,6 +46,8 @@ from telegram_checker.telegram_utils.report import load_report_tree
 from telegram_checker.utils.output_display import print_stats_report
 
 LOG = get_logger()
+# Monotonic time of the last report sent (reports are spaced by SLEEP_BETWEEN_REPORTS)
+_last_report_at = 0.0
 
 
 def decide_action(lv1: str, confidence: float, interactive: bool, all_interactive: bool) -> tuple[bool, bool]:
@@ -156,6 +158,7 @@ def resolve_llm_params(args) -> dict[str, str]:
     }
 
 def report_message(client, entity, msg, llm_url, llm_model, report_tree, interactive, all_interactive, stats, padding=0):
+    global _last_report_at
     text = msg.text.strip()
     message_id = msg.id
 
@@ -238,8 +241,16 @@ def report_message(client, entity, msg, llm_url, llm_model, report_tree, interac
         confirmed = True
 
     if confirmed:
+        # Small pause between reports to respect Telegram rate limits:
+        # only what's left of it after the analysis, and none after the last report
+        wait = _last_report_at + SLEEP_BETWEEN_REPORTS - monotonic()
+        if wait > 0:
+            sleep(wait)
         # ToDo: Get matched report options to use in statistics (counter stats['report_path'], with path being "Opt1/Opt2")
-        success = send_report(client, entity, message_id, lv1, lv2, report_text, padding=padding)
+        try:
+            success = send_report(client, entity, message_id, lv1, lv2, report_text, padding=padding)
+        finally:
+            _last_report_at = monotonic()
         if success:
             if ask_user:
                 stats['reported_manual'] += 1
@@ -248,9 +259,6 @@ def report_message(client, entity, msg, llm_url, llm_model, report_tree, interac
         else:
             stats['errors'] += 1
 
-    # Small pause between reports to respect Telegram rate limits
-    sleep(SLEEP_BETWEEN_REPORTS)
-
 
 def run_report(client, args, identifier=None, llm=LLM_DEFAULT, padding=0):
     """
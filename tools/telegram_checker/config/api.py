@@ -1,4 +1,31 @@
-API_ID = int(open('.secret/api_id', 'r', encoding='utf-8').read().strip())
-API_HASH = open('.secret/api_hash', 'r', encoding='utf-8').read().strip()
-SLEEP_BETWEEN_CHECKS = 20  # seconds between each check, doubled when checking for invites
+from functools import cache
+from pathlib import Path
+
+
+SLEEP_BETWEEN_CHECKS = 20  # seconds between each check (starting rate of full checks), doubled when checking for invites
 SLEEP_BETWEEN_REPORTS = 5  # seconds between each report
+CONCURRENT_CHECKS = 1  # entities checked at the same time
+INVITE_CONCURRENCY = 3  # invite links of a single entity checked at the same time
+MAX_CHECK_RETRIES = 5  # FloodWait/ConnectionError retries of a single check, before giving up on the entity
+RETRY_BACKOFF_MAX = 5 * 60  # longest wait before retrying after a ConnectionError (doubled after each failure)
+ID_BATCH_SIZE = 100  # IDs resolved per users.getUsers / channels.getChannels call
+# Adaptive rate limiting of entity checks (calls per second, per account)
+RATE_LIMIT_MIN = 1 / 120   # never slower than one check every 2 minutes
+RATE_LIMIT_MAX = 6 / 60    # never faster than 6 checks per minute (twice the starting pace of SLEEP_BETWEEN_CHECKS)
+RATE_LIMIT_BURST = 1       # checks allowed in a row after an idle time (no burst: idle time is not saved up)
+RATE_INCREASE_AFTER = 20   # checks without FloodWait before raising the rate by 10% (up to RATE_LIMIT_MAX)
+RATE_FILE = '.secret/rate.json'  # last safe rate of each account, kept between runs
+
+
+@cache
+def load_api_credentials():
+    """
+    Reads the API credentials from .secret, once per run (on first connection, not on import).
+
+    Returns:
+        tuple: (api_id, api_hash)
+    """
+    secret_dir = Path('.secret')
+    api_id = int((secret_dir / 'api_id').read_bytes().strip())
+    api_hash = (secret_dir / 'api_hash').read_bytes().decode('utf-8').strip()
+    return api_id, api_hash
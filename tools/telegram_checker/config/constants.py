@@ -10,6 +10,15 @@ AI_REPORT_FIELD = "reports"
 AI_REPORT_FIELD_NAME = 'ai'
 AI_LEGIT_FIELD = "legit"
 THROTTLE_TIME = 0.2
+THROTTLE_MAX_BACKLOG = 20  # lines waiting in the background writer, beyond which they are written without throttle
+LOG_FILE_BUFFER_SIZE = 1 << 20  # bytes buffered before the log files are written to disk
+PRESCAN_PROCESSES_MIN_FILES = 500  # from this many files, the pre-scan runs in worker processes
+ENTITY_PARSE_CACHE_SIZE = 256  # parsed entities kept in memory, by (file, modification time)
+STATUS_DATETIME_CACHE_SIZE = 8192  # parsed status dates (files checked in the same run share them)
+ENTITY_CACHE_FILE = '.secret/cache.sqlite'  # results of previous checks, read back within --skip-time
+SCAN_CACHE_FILE = '.secret/scan_cache.sqlite'  # pre-scan results of unchanged files
+ENTITY_MEMORY_CACHE_SIZE = 4096  # results of the current run kept in memory, for identifiers found in several files
+RESULTS_FILE = '.secret/results.jsonl'  # results of the last dry-run, one JSON object per line
 
 # ============================================
 # CONSTANTS
@@ -57,6 +66,33 @@ EMOJI = {
     'connection':  "📶"
 }
 
+# Emojis used on hot output paths, bound once
+EMOJI_ACTIVE      = EMOJI['active']
+EMOJI_BANNED      = EMOJI['banned']
+EMOJI_DELETED     = EMOJI['deleted']
+EMOJI_ID_MISMATCH = EMOJI['id_mismatch']
+EMOJI_UNKNOWN     = EMOJI['unknown']
+EMOJI_ERROR       = EMOJI['error']
+EMOJI_SKIP        = EMOJI['skip']
+EMOJI_FILE        = EMOJI['file']
+EMOJI_ID          = EMOJI['id']
+EMOJI_NO_EMOJI    = EMOJI['no_emoji']
+EMOJI_IGNORED     = EMOJI['ignored']
+EMOJI_DRY_RUN     = EMOJI['dry-run']
+EMOJI_HANDLE      = EMOJI['handle']
+EMOJI_STATS       = EMOJI['stats']
+EMOJI_WARNING     = EMOJI['warning']
+EMOJI_INFO        = EMOJI['info']
+EMOJI_METHODS     = EMOJI['methods']
+EMOJI_CHANGE      = EMOJI['change']
+EMOJI_PAUSE       = EMOJI['pause']
+EMOJI_CONNECTION  = EMOJI['connection']
+EMOJI_FALLBACK    = EMOJI['fallback']
+EMOJI_INVITE      = EMOJI['invite']
+EMOJI_SAVED       = EMOJI['saved']
+EMOJI_REASON      = EMOJI['reason']
+EMOJI_TEXT        = EMOJI['text']
+
 STATS_INIT = {
     'report': [
         'analyzed', 'reported_auto', 'reported_manual', 'skipped_manual',
@@ -79,7 +115,7 @@ STATS_INIT = {
 STATS_INIT_EXTRA = {
     'report':      lambda: {'tags': Counter(), 'llm_time': []},
     'mass_report': lambda: {'tags': Counter(), 'llm_time': []},
-    'check':       lambda: {'method': {'id': 0, 'username': 0, 'invite': 0}},
+    'check':       lambda: {'method': Counter(id=0, username=0, invite=0, cache=0)},
 }
 
 
@@ -90,19 +126,31 @@ def make_stats(purpose):
 # REGEX
 # ============================================
 
-REGEX_ID = re.compile(pattern=r'^id:\s*`?(\d+)`?', flags=re.MULTILINE)
-REGEX_TYPE = re.compile(pattern=r'^type:\s*(\w+)', flags=re.MULTILINE)
-REGEX_USERNAME_INLINE = re.compile(pattern=r'^username:\s*`?@([a-zA-Z0-9_]{5,32})`?', flags=re.MULTILINE)
 REGEX_USERNAME_BLOCK_START = re.compile(pattern=r'^username:\s*$', flags=re.MULTILINE)
 REGEX_USERNAME_ENTRY = re.compile(pattern=r'-\s*`@([a-zA-Z0-9_]{5,32})`')
-REGEX_INVITE_INLINE = re.compile(pattern=r'^invite:\s*(?:~~)?https://t\.me/\+([a-zA-Z0-9_-]+)', flags=re.MULTILINE)
 REGEX_INVITE_BLOCK_START = re.compile(pattern=r'^invite:\s*$', flags=re.MULTILINE)
 REGEX_INVITE_LINK = re.compile(pattern=r'-\s*(?:~~)?https://t\.me/\+([a-zA-Z0-9_-]+)')
-REGEX_STATUS_BLOCK_START = re.compile(pattern=r'^status:\s*$', flags=re.MULTILINE)
-REGEX_STATUS_ENTRY_FULL = re.compile(pattern=r'^\s*-\s*`([^`]+)`\s*,\s*`(\d{4}-\d{2}-\d{2})\s+(\d{2}:\d{2})`', flags=re.MULTILINE)
-REGEX_STATUS_BLOCK_PATTERN = re.compile(pattern=r'^\s*-\s*`[^`]+`,\s*`\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}`', flags=re.MULTILINE)
-REGEX_STATUS_SUB_ITEM = re.compile(pattern=r'^\s{2,}-\s')
 REGEX_NEXT_FIELD = re.compile(pattern=r'^[a-z_]+:\s', flags=re.MULTILINE)
 REGEX_INVITE_LINK_RAW = re.compile(r"^https?://(t\.me|telegram\.me|telegram\.dog)/\+[a-zA-Z0-9_-]{10,32}$")
 REGEX_USERNAME_RAW = re.compile(r'^[a-zA-Z][a-zA-Z0-9_]{3,30}[a-zA-Z0-9]$')
 REGEX_INVITE_HASH = re.compile(r'^\+[a-zA-Z0-9_-]{10,32}$')
+REGEX_TIME_EXPRESSION = re.compile(r'\d+(?:\.\d+)?(?:[*+-]\d+(?:\.\d+)?)*', flags=re.ASCII)
+REGEX_TIME_OPERATOR = re.compile(r'([+-])')
+
+# Bytes variants, to scan and splice raw file buffers without decoding and splitting them into lines
+REGEX_ID_B = re.compile(pattern=rb'^id:\s*`?(\d+)`?', flags=re.MULTILINE)
+REGEX_FRONTMATTER_B = re.compile(pattern=rb'\A[ \t]*---[ \t]*\r?\n.*?^[ \t]*---[ \t]*(?:\r?\n|\Z)', flags=re.MULTILINE | re.DOTALL)
+# Lines kept in a status block: entries (with date/time) and their sub-items, whole lines with their line ending
+REGEX_STATUS_BLOCK_LINE_B = re.compile(
+    pattern=rb'(?:\A|(?<=\n)|(?<=\r)(?!\n))(?:'
+            rb'(?P<entry>[^\S\r\n]*+-[^\S\r\n]*+`[^`\r\n]++`,[^\S\r\n]*+`\d{4}-\d{2}-\d{2}[^\S\r\n]++\d{2}:\d{2}`[^\r\n]*+(?:\r\n|\r|\n|\Z))'
+            rb'|(?P<sub_item>[^\S\r\n]{2,}+-(?:[^\S\r\n][^\r\n]*+(?:\r\n|\r|\n|\Z)|\r\n|\r|\n))'
+            rb')'
+)
+REGEX_NEXT_FIELD_B = re.compile(pattern=rb'^[a-z_]+:\s', flags=re.MULTILINE)
+# id, type, inline username and status block start, in a single pass (pre-scan)
+REGEX_SCAN_FIELDS_B = re.compile(
+    pattern=rb'^(?:id:[ \t]*`?(?P<id>\d+)|type:[ \t]*`?(?P<type>\w+)|username:[ \t]*`?@(?P<username>[a-zA-Z0-9_]{5,32})|(?P<status>[ \t]*status:)[ \t]*\r?$)',
+    flags=re.MULTILINE
+)
+REGEX_STATUS_ENTRY_FULL_B = re.compile(pattern=rb'^\s*+-\s*+`([^`]++)`\s*+,\s*+`(\d{4}-\d{2}-\d{2})\s++(\d{2}:\d{2})`', flags=re.MULTILINE)
@@ -8,10 +8,6 @@ Usage:
   python check_status_tg.py --path . --skip-time 86400 --skip unknown banned
   python check_status_tg.py --path . --skip-time "24*60*60"
 
-ToDo: Can we consider using more than 1 account at the same time,
-      and check with every account before settling on a status?
-      Should reveal helpful for groups where one account has been accepted,
-      and that others can't access.
 ToDo: For --get-identifiers, add:
       --only-tags tag1,tag2,...
 """
@@ -22,14 +18,11 @@ ToDo: For --get-identifiers, add:
 from pathlib import Path
 
 ## Telegram-Checker
+## Commands (and Telethon) are imported in their branch: --help and argument errors don't wait for them
 from telegram_checker.config.constants import EMOJI
 from telegram_checker.telegram_utils.exceptions import TelegramUtilsClientError
 from telegram_checker.utils.exceptions import GracefullyExit, DebugException
-from telegram_checker.utils.helpers import copy_to_clipboard, parse_time_expression, print_debug, seconds_to_time
-from telegram_checker.telegram_utils.client import connect_to_telegram
-from telegram_checker.commands.full_check import full_check
-from telegram_checker.commands.list_identifiers import list_identifiers
-from telegram_checker.commands.get_entity_info import get_entity_info
+from telegram_checker.utils.helpers import copy_to_clipboard, print_debug, seconds_to_time, list_md_files
 from telegram_checker.commands.args_parser import build_arg_parser, validate_args
 from telegram_checker.commands.exceptions import ValidationException, CanceledByUser
 from telegram_checker.utils.logger import init_logger
@@ -67,6 +60,8 @@ def main():
 
         # Handle --get-info mode
         if args.get_info:
+            from telegram_checker.telegram_utils.client import connect_to_telegram
+            from telegram_checker.commands.get_entity_info import get_entity_info
             client = connect_to_telegram(args.user)
             try:
                 entity_info = get_entity_info(
@@ -81,14 +76,14 @@ def main():
                 client.disconnect()
             raise GracefullyExit('Done with the entity!')
 
-        # Parse skip-time if provided
-        skip_time_seconds = None
-        if args.skip_time:
-            skip_time_seconds = parse_time_expression(args.skip_time)
+        # Skip-time, already parsed by argparse
+        skip_time_seconds = args.skip_time
+        if skip_time_seconds:
             log.info(f"Skip time: {skip_time_seconds}s ({seconds_to_time(skip_time_seconds)})", EMOJI["time"])
 
         # Handle --report mode
         if args.report:
+            from telegram_checker.telegram_utils.client import connect_to_telegram
             from telegram_checker.commands.report import run_report, resolve_llm_params
             client = connect_to_telegram(args.user)
             try:
@@ -119,7 +114,7 @@ def main():
         if not path.exists():
             raise ValidationException(f'Path does not exist: {path}')
 
-        md_files = list(path.glob('*.md'))
+        md_files = list_md_files(path)
 
         if not md_files:
             raise ValidationException(f'No .md files found in {path}')
@@ -130,19 +125,23 @@ def main():
             log.info(f"Mode: DRY-RUN (no file modifications)", emoji='🔎')
         log.info()
 
-        # Connect to Telegram
-        if not (args.get_identifiers == 'all'):
+        # Connect to Telegram (the full check connects on its own, once it has something to check)
+        if args.get_identifiers == 'valid' or args.mass_report:
+            from telegram_checker.telegram_utils.client import connect_to_telegram
             client = connect_to_telegram(args.user)
 
         # Handle --get-identifiers mode without connection if mode is 'all'
         if args.get_identifiers:
-            list_identifiers(
-                client,
-                md_files,
-                args
-            )
-            if client:
-                client.disconnect()
+            from telegram_checker.commands.list_identifiers import list_identifiers
+            try:
+                list_identifiers(
+                    client,
+                    md_files,
+                    args
+                )
+            finally:
+                if client:
+                    client.disconnect()
             raise GracefullyExit('Done with the identifiers!')
 
         # Handle --mass-report mode
@@ -157,13 +156,14 @@ def main():
             raise GracefullyExit('Done with mass reporting!')
 
         # Handle default mode (full check)
+        from telegram_checker.telegram_utils.client_pool import ClientPool
+        from telegram_checker.commands.full_check import full_check
         try:
-            full_check(client, args, args.ignore, md_files, skip_time_seconds)
+            # Other accounts (--pool) share the work and confirm negative statuses
+            full_check(lambda: ClientPool.connect([args.user, *args.pool]), args, args.ignore, md_files, skip_time_seconds)
         except KeyboardInterrupt:
             if args.no_exit: input('Press Enter key to exit')
             exit(0)
-        finally:
-            client.disconnect()
         raise GracefullyExit('Done with the full check!')
 
     except GracefullyExit as e:
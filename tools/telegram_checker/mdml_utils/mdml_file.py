@@ -1,157 +1,180 @@
+import os
+from pathlib import Path
 from telegram_checker.config.constants import (
-    REGEX_ID,
-    EMOJI,
+    REGEX_ID_B,
+    EMOJI_CHANGE,
+    EMOJI_DRY_RUN,
+    EMOJI_ID_MISMATCH,
+    EMOJI_IGNORED,
+    EMOJI_INFO,
+    EMOJI_REASON,
+    EMOJI_SAVED,
+    EMOJI_TEXT,
+    EMOJI_WARNING,
     REGEX_NEXT_FIELD,
-    REGEX_STATUS_BLOCK_PATTERN,
-    REGEX_STATUS_SUB_ITEM,
+    REGEX_NEXT_FIELD_B,
+    REGEX_FRONTMATTER_B,
+    REGEX_STATUS_BLOCK_LINE_B,
     MAX_STATUS_ENTRIES,
-    REGEX_STATUS_BLOCK_START, AI_REPORT_FIELD, AI_REPORT_FIELD_NAME
+    AI_REPORT_FIELD, AI_REPORT_FIELD_NAME
 )
 from telegram_checker.utils.helpers import (
     get_date_time,
     cut_text
 )
+from telegram_checker.mdml_utils.mdml_parser import find_status_line
 from telegram_checker.utils.logger import get_logger
 
 LOG = get_logger()
 
 
-def write_id_to_md(file_path, entity_id):
+def _detect_newline(buffer):
+    """Returns the line ending used by a raw file buffer, to keep it on inserted lines."""
+    return b'\r\n' if b'\r\n' in buffer else b'\n'
+
+
+def _insert_id(content, entity_id):
     """
-    Writes the entity ID at the beginning of the markdown file.
-    Only writes if no ID field exists yet.
+    Inserts the entity ID at the beginning of a raw file buffer.
 
     Insertion logic:
     - If YAML frontmatter exists (---...---), insert after it with blank line
     - Otherwise, insert at the very beginning (line 0)
 
-    Args:
-        file_path: Path to markdown file
-        entity_id: Entity ID to write
-
     Returns:
-        bool: True if ID was written, False if ID already exists or error
+        bytes: New buffer, or None if an ID field already exists
     """
-    with open(file_path, 'r', encoding='utf-8') as f:
-        content = f.read()
-
     # Check if ID already exists
-    if REGEX_ID.search(content):
-        return False
+    if REGEX_ID_B.search(content):
+        return None
 
-    lines = content.split('\n')
+    newline = _detect_newline(content)
+    id_line = f"id: `{entity_id}`".encode('utf-8') + newline
 
     # Detect YAML frontmatter
     insert_pos = 0  # Default: very beginning
-
-    if len(lines) > 0 and lines[0].strip() == '---':
-        # Look for closing ---
-        for i in range(1, len(lines)):
-            if lines[i].strip() == '---':
-                # Insert after the closing --- and a blank line
-                insert_pos = i + 1
-                # Add blank line if not already present
-                if insert_pos < len(lines) and lines[insert_pos].strip() != '':
-                    lines.insert(insert_pos, '')
-                    insert_pos += 1
-                break
-
-    # Insert the ID field
-    lines.insert(insert_pos, f"id: `{entity_id}`")
-
-    # Write back
-    with open(file_path, 'w', encoding='utf-8') as f:
-        f.write('\n'.join(lines))
-
-    return True
-
-
-def update_status_in_md(file_path, new_status, restriction_details=None):
+    frontmatter = REGEX_FRONTMATTER_B.match(content)
+    if frontmatter:
+        # Insert after the closing --- and a blank line
+        insert_pos = frontmatter.end()
+        next_line_end = content.find(b'\n', insert_pos)
+        next_line = content[insert_pos:next_line_end if next_line_end != -1 else len(content)]
+        if not content[:insert_pos].endswith(b'\n'):
+            # Closing --- is the last line of the file
+            id_line = newline + id_line
+        elif next_line.strip():
+            # Add blank line if not already present
+            id_line = newline + id_line
+
+    return content[:insert_pos] + id_line + content[insert_pos:]
+
+
+def _insert_status(content, new_status, restriction_details=None, checked_at=None):
     """
-    Updates the status block in a markdown file by adding a new status entry.
+    Adds a new status entry on top of the status block of a raw file buffer,
+    dated `checked_at` (a cached result's check), or now.
     Keeps a maximum of MAX_STATUS_ENTRIES entries.
-    When pruning, removes the middle entry to preserve both recent and oldest entries.
-    """
-    with open(file_path, 'r', encoding='utf-8') as f:
-        lines = f.readlines()
+    When pruning, removes the middle entries to preserve both recent and oldest entries.
 
+    Returns:
+        bytes: New buffer, or None if the file has no status block
+    """
     # 1. Find the status: block
-    status_line_idx = None
-    for i, line in enumerate(lines):
-        if REGEX_STATUS_BLOCK_START.match(line.strip()):
-            status_line_idx = i
-            break
+    status_end = find_status_line(content)
+    if status_end is None:
+        return None
 
-    if status_line_idx is None:
-        LOG.info(f"{EMOJI['warning']} No 'status:' block found in {file_path.name}", padding=2)
-        return False
+    newline = _detect_newline(content)
+    block_start = content.find(b'\n', status_end) + 1
+    if block_start == 0:
+        # 'status:' is the last line of the file, without line ending
+        content += newline
+        block_start = len(content)
 
     # 2. Find the next field (end of status block)
-    next_field_idx = None
-    for i in range(status_line_idx + 1, len(lines)):
-        # Next field starts with word characters followed by ':'
-        if REGEX_NEXT_FIELD.match(lines[i]):
-            next_field_idx = i
-            break
-
     # If no next field found, status block goes to end of file
-    if next_field_idx is None:
-        next_field_idx = len(lines)
+    next_field = REGEX_NEXT_FIELD_B.search(content, block_start)
+    block_end = next_field.start() if next_field else len(content)
 
-    # 3. Extract existing status entries from the block
-    status_block_lines = lines[status_line_idx + 1:next_field_idx]
+    # 3. Extract existing status entries from the block, with their sub-items (malformed lines are dropped)
     existing_entries = []
-    current_entry = []
-
-    for line in status_block_lines:
-        # Check if this is a new status entry (has date/time)
-        if REGEX_STATUS_BLOCK_PATTERN.match(line):
-            # Save previous entry if exists
-            if current_entry:
-                existing_entries.append(current_entry)
-            # Start new entry
-            current_entry = [line]
-        # Check if this is a sub-item (part of current entry)
-        elif REGEX_STATUS_SUB_ITEM.match(line) and current_entry:
-            current_entry.append(line)
-        # Else: ignore malformed lines
-
-    # Don't forget the last entry
-    if current_entry:
-        existing_entries.append(current_entry)
+    for line in REGEX_STATUS_BLOCK_LINE_B.finditer(content, block_start, block_end):
+        if line.lastgroup == 'entry':
+            existing_entries.append([line.group()])
+        elif existing_entries:
+            existing_entries[-1].append(line.group())
 
     # 4. Create new status entry
-    new_entry = [f"- `{new_status}`, `{get_date_time()}`\n"]
+    new_entry = [f"- `{new_status}`, `{checked_at or get_date_time()}`"]
 
     if restriction_details:
         if 'reason' in restriction_details and restriction_details['reason']:
-            new_entry.append(f"  - reason: `{restriction_details['reason']}`\n")
+            new_entry.append(f"  - reason: `{restriction_details['reason']}`")
         if 'text' in restriction_details and restriction_details['text']:
             text = restriction_details['text'].replace('`', "'")
-            new_entry.append(f"  - text: `{text}`\n")
+            new_entry.append(f"  - text: `{text}`")
 
-    # 5. Prune old entries if needed
-    if len(existing_entries) >= MAX_STATUS_ENTRIES - 1:
-        middle_index = len(existing_entries) // 2
-        existing_entries.pop(middle_index)
+    # 5. Prune old entries if needed, in a single slice around the middle
+    # (also catches up files that already have too many entries)
+    excess = len(existing_entries) - (MAX_STATUS_ENTRIES - 2)
+    if excess > 0:
+        start = len(existing_entries) // 2 - excess // 2
+        del existing_entries[start:start + excess]
 
-    # 6. Reconstruct file: before + status: + new entry + old entries + after
-    new_lines = []
-    new_lines.extend(lines[:status_line_idx + 1])  # Everything before and including 'status:'
-    new_lines.extend(new_entry)  # New status entry
-    for entry in existing_entries:  # Existing entries
-        new_lines.extend(entry)
-    new_lines.append('\n')
-    new_lines.extend(lines[next_field_idx:])  # Everything after status block
+    # 6. Splice: before + status: + new entry + old entries + after
+    parts = [content[:block_start]]
+    parts.extend(line.encode('utf-8') + newline for line in new_entry)
+    for entry in existing_entries:
+        parts.extend(entry)
+    parts.append(newline)
+    parts.append(content[block_end:])
 
-    # 7. Write back
-    with open(file_path, 'w', encoding='utf-8') as f:
-        f.writelines(new_lines)
+    return b''.join(parts)
 
-    return True
 
+def apply_updates(file_path, updates):
+    """
+    Applies several updates to a markdown file, with a single read and a single (atomic) write.
+
+    Args:
+        file_path: Path to markdown file
+        updates (dict): Updates to apply, among:
+            - 'id': Entity ID to write (only if no ID field exists yet)
+            - 'status': New status entry to add to the status block
+            - 'restriction_details': Restriction details of the new status (if any)
+            - 'checked_at': Date and time of the new status, if not checked just now (cached result)
+
+    Returns:
+        set: Names of the updates applied ('id', 'status'); empty if the file was not written
+    """
+    file_path = Path(file_path)
+    content = file_path.read_bytes()
+    applied = set()
+
+    if updates.get('id') is not None:
+        new_content = _insert_id(content, updates['id'])
+        if new_content is not None:
+            content = new_content
+            applied.add('id')
+
+    if updates.get('status') is not None:
+        new_content = _insert_status(content, updates['status'], updates.get('restriction_details'), updates.get('checked_at'))
+        if new_content is None:
+            LOG.info(f"{EMOJI_WARNING} No 'status:' block found in {file_path.name}", padding=2)
+        else:
+            content = new_content
+            applied.add('status')
 
-def process_and_update_file(md_file, status, restriction_details, actual_id, expected_id, last_status, should_ignore, is_dry_run):
+    if applied:
+        # Written next to the file, then renamed: a crash never leaves a truncated file
+        tmp_path = file_path.with_name(f".{file_path.name}.tmp")
+        tmp_path.write_bytes(content)
+        os.replace(tmp_path, file_path)
+
+    return applied
+
+
+def process_and_update_file(md_file, status, restriction_details, actual_id, expected_id, last_status, should_ignore, is_dry_run, new_id=None, checked_at=None):
     """
     Displays additional info, updates file if needed, and prepares result data.
 
@@ -164,32 +187,36 @@ def process_and_update_file(md_file, status, restriction_details, actual_id, exp
         last_status: Previous status
         should_ignore: Whether to ignore this status
         is_dry_run: Whether in dry-run mode
+        new_id: Recovered entity ID to write along with the status (if any)
+        checked_at: Date and time of the check, for a cached result (None if checked just now)
 
     Returns:
-        tuple: (should_track_change, was_updated)
+        tuple: (should_track_change, was_updated, id_written)
             - should_track_change: True if status changed
             - was_updated: True if file was actually updated
+            - id_written: True if new_id was written
     """
     # Display additional info
     if status == 'id_mismatch' and actual_id:
-        LOG.info(f"  {EMOJI["id_mismatch"]} Expected ID: {expected_id}, found ID: {actual_id}")
+        LOG.info(f"  {EMOJI_ID_MISMATCH} Expected ID: {expected_id}, found ID: {actual_id}")
 
     if last_status is not None and last_status != status:
-        LOG.info(f"  {EMOJI["change"]} STATUS CHANGE: {last_status} → {status}")
+        LOG.info(f"  {EMOJI_CHANGE} STATUS CHANGE ({md_file.name}): {last_status} → {status}")
 
     if restriction_details:
         if 'reason' in restriction_details:
-            LOG.info(f"{EMOJI["reason"]} Reason: {restriction_details['reason']}", padding=2)
+            LOG.info(f"{EMOJI_REASON} Reason: {restriction_details['reason']}", padding=2)
         if 'text' in restriction_details:
             text_preview = cut_text(restriction_details['text'], 120-11)
-            LOG.info(f"{EMOJI["text"]} Text: {text_preview}", padding=2)
+            LOG.info(f"{EMOJI_TEXT} Text: {text_preview}", padding=2)
 
-    # Handle file updates
+    # Handle file updates: everything is written at once
     should_track_change = False
     was_updated = False
+    updates = {} if is_dry_run or new_id is None else {'id': new_id}
 
     if should_ignore:
-        LOG.info(f"{EMOJI["ignored"]} Ignoring status '{status}' (not updating file)", padding=2)
+        LOG.info(f"{EMOJI_IGNORED} Ignoring status '{status}' (not updating file)", padding=2)
     else:
         # Track status change
         if last_status != status:
@@ -197,20 +224,30 @@ def process_and_update_file(md_file, status, restriction_details, actual_id, exp
 
         # Update file
         if not is_dry_run:
-            if update_status_in_md(md_file, status, restriction_details):
-                LOG.info(f"File updated", EMOJI["saved"], padding=2)
-                was_updated = True
+            updates['status'] = status
+            updates['restriction_details'] = restriction_details
+            updates['checked_at'] = checked_at
         else:
             # Show what WOULD be written
-            LOG.info(f"Would add:", EMOJI["dry-run"], padding=2)
-            LOG.info(f"`{status}`, `{get_date_time()}`", padding=4)
+            LOG.info("Would add:", EMOJI_DRY_RUN, padding=2)
+            LOG.info(f"`{status}`, `{checked_at or get_date_time()}`", padding=4)
             if restriction_details:
                 if 'reason' in restriction_details:
                     LOG.info(f"- reason: `{restriction_details['reason']}`", padding=4)
                 if 'text' in restriction_details:
                     LOG.info(f"- text: `{restriction_details['text'][:50]}...`", padding=4)
 
-    return should_track_change, was_updated
+    applied = apply_updates(md_file, updates) if updates else set()
+    id_written = 'id' in applied
+    if id_written:
+        LOG.info(f"ID written to file: `{new_id}`", EMOJI_SAVED, padding=2)
+    elif 'id' in updates:
+        LOG.info("ID already present in file.", EMOJI_INFO, padding=2)
+    if 'status' in applied:
+        LOG.info(f"File updated: {md_file.name}", EMOJI_SAVED, padding=2)
+        was_updated = True
+
+    return should_track_change, was_updated, id_written
 
 
 def append_report_to_md(file_path, account, analyzed, reported, tags):
@@ -226,7 +263,6 @@ def append_report_to_md(file_path, account, analyzed, reported, tags):
         tags: List of tag strings
     """
     from datetime import datetime
-    from pathlib import Path
 
     now = datetime.now().strftime('%Y-%m-%d %H:%M')
     tags_str = " ; ".join(f"`{'' if tag.startswith('#') else '#'}{tag}`" for tag in tags)
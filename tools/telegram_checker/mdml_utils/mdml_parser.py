@@ -1,4 +1,48 @@
-from telegram_mdml.telegram_mdml import TelegramEntity
+import os
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, astuple
+from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+from weakref import WeakKeyDictionary
+from telegram_mdml.telegram_mdml import TelegramEntity, InvalidTypeError, MissingFieldError, InvalidFieldError
+from telegram_checker.config.constants import (
+    REGEX_SCAN_FIELDS_B,
+    REGEX_STATUS_ENTRY_FULL_B,
+    REGEX_NEXT_FIELD_B,
+    PRESCAN_PROCESSES_MIN_FILES,
+    ENTITY_PARSE_CACHE_SIZE,
+    STATUS_DATETIME_CACHE_SIZE,
+    EMOJI_ERROR
+)
+from telegram_checker.mdml_utils.scan_cache import ScanCache
+from telegram_checker.utils.logger import get_logger
+
+LOG = get_logger()
+
+# Last status of the parsed entities (see get_last_status())
+_last_status_cache = WeakKeyDictionary()
+
+
+@dataclass
+class ScanResult:
+    expected_id: int = None
+    entity_type: str = None
+    has_identifier: bool = False
+    last_status: str = None
+    last_datetime: datetime = None
+
+
+@dataclass(slots=True)
+class EntityFacts:
+    entity_type: str = None
+    expected_id: int = None
+    identifiers: list = None
+    is_invite: bool = None
+    last_status: str = None
+    last_datetime: datetime = None
+    has_status_block: bool = False
 
 
 def extract_telegram_identifiers(entity: TelegramEntity):
@@ -10,7 +54,7 @@ def extract_telegram_identifiers(entity: TelegramEntity):
 
     Returns:
         tuple: (identifier, is_invite) where:
-            - identifier: str (username) or list[str] (invite hashes)
+            - identifier: str (username) or list[str] (invite links, ready to be resolved)
             - is_invite: bool (False for username, True for invites)
     """
     # Priority 1: Check for username (non-strikethrough)
@@ -21,13 +65,33 @@ def extract_telegram_identifiers(entity: TelegramEntity):
     # Priority 2: Check for invites (non-strikethrough)
     invites = entity.get_invites().active()
     if invites:
-        # Return list of invite hashes
-        invite_hashes = [invite.hash for invite in invites]
-        return invite_hashes, True
+        # Return list of invite links, built once for every check of the entity
+        invite_links = [f'https://t.me/+{invite.hash}' for invite in invites]
+        return invite_links, True
 
     return None, None
 
 
+@lru_cache(maxsize=ENTITY_PARSE_CACHE_SIZE)
+def _load_entity(path_str, mtime_ns):
+    return TelegramEntity.from_file(Path(path_str))
+
+
+def load_entity(md_file) -> TelegramEntity:
+    """
+    TelegramEntity.from_file(), memoized on (path, modification time):
+    a file is parsed again only once it has been modified.
+    The returned entity is shared: it must not be modified.
+
+    Args:
+        md_file (Path): Markdown file
+
+    Returns:
+        TelegramEntity: Parsed entity
+    """
+    return _load_entity(str(md_file), os.stat(md_file).st_mtime_ns)
+
+
 def get_last_status(entity: TelegramEntity):
     """
     Extracts the most recent status entry from Telegram MDML entity.
@@ -47,8 +111,208 @@ def get_last_status(entity: TelegramEntity):
         - `active`, `2026-01-18 14:32`
         - `unknown`, `2026-01-17 10:15`
     """
+    try:
+        return _last_status_cache[entity]
+    except (KeyError, TypeError):
+        pass
+
     has_status_block = entity.has_field('status')
     status = entity.get_status(allow_strikethrough=False)
     if status:
-        return status.value, status.date, has_status_block
-    return None, None, has_status_block
+        result = status.value, status.date, has_status_block
+    else:
+        result = None, None, has_status_block
+
+    try:
+        _last_status_cache[entity] = result
+    except TypeError:
+        # Entity not weak-referenceable: not memoized
+        pass
+    return result
+
+
+def extract_all(entity: TelegramEntity, log=LOG) -> EntityFacts:
+    """
+    Extracts, in one go, everything the checks need from a Telegram MDML entity:
+    type, ID, identifiers and last status.
+    Invalid or missing type and ID are returned as None.
+
+    Args:
+        entity (TelegramEntity): Telegram MDML entity
+        log: Logger (or LogBuffer) for the errors
+
+    Returns:
+        EntityFacts: Extracted fields, with identifiers always as a list (or None)
+    """
+    facts = EntityFacts()
+
+    try:
+        facts.entity_type = entity.get_type()
+    except (InvalidTypeError, MissingFieldError):
+        pass
+    except Exception as e:
+        log.error(f"{EMOJI_ERROR} Error: {e}")
+
+    try:
+        facts.expected_id = entity.get_id()
+    except InvalidFieldError:
+        pass
+    except Exception as e:
+        log.error(f"{EMOJI_ERROR} Error: {e}")
+
+    identifiers, facts.is_invite = extract_telegram_identifiers(entity)
+    if isinstance(identifiers, list):
+        # List of invite links
+        facts.identifiers = identifiers
+    elif isinstance(identifiers, str):
+        # One username
+        facts.identifiers = [identifiers]
+
+    facts.last_status, facts.last_datetime, facts.has_status_block = get_last_status(entity)
+    return facts
+
+
+def find_status_line(content: bytes) -> int | None:
+    """
+    Finds the 'status:' line opening the status block of a raw file buffer
+    (a line holding only 'status:', between spaces or tabs), with plain bytes searches.
+
+    Args:
+        content (bytes): Raw content of a markdown file
+
+    Returns:
+        int: Offset of the end of the line (before its line ending), or None if there's no status block
+    """
+    start = 0
+    while (found := content.find(b'status:', start)) != -1:
+        line_start = content.rfind(b'\n', 0, found) + 1
+        line_end = content.find(b'\n', found)
+        if line_end == -1:
+            line_end = len(content)
+        # Only spaces before, and only spaces (and \r) after
+        if not content[line_start:found].strip(b' \t') \
+                and not content[found + len(b'status:'):line_end].removesuffix(b'\r').strip(b' \t'):
+            return line_end
+        start = found + 1
+    return None
+
+
+@lru_cache(maxsize=STATUS_DATETIME_CACHE_SIZE)
+def _parse_status_datetime(date, time):
+    # `YYYY-MM-DD` and `HH:MM`, as matched by REGEX_STATUS_ENTRY_FULL_B: read by position, without strptime()
+    # Raises ValueError on an invalid date or time
+    return datetime(int(date[0:4]), int(date[5:7]), int(date[8:10]), int(time[0:2]), int(time[3:5]))
+
+
+def _read_status_block(content, block_start):
+    # Most recent valid entry of the status block starting at `block_start`
+    last_status, last_datetime = None, None
+    next_field = REGEX_NEXT_FIELD_B.search(content, block_start)
+    block_end = next_field.start() if next_field else len(content)
+    for entry in REGEX_STATUS_ENTRY_FULL_B.finditer(content, block_start, block_end):
+        try:
+            entry_datetime = _parse_status_datetime(entry.group(2), entry.group(3))
+        except ValueError:
+            continue
+        if last_datetime is None or entry_datetime > last_datetime:
+            last_status = entry.group(1).decode('utf-8')
+            last_datetime = entry_datetime
+    return last_status, last_datetime
+
+
+def scan_md_fast(path) -> ScanResult:
+    """
+    Reads the few fields needed to decide if a file can be skipped (id, type, inline username,
+    last status), with bytes regexes over the raw file, without building a TelegramEntity.
+
+    Only plain fields are recognized: struck-through usernames or status entries are not,
+    so an empty result means "parse the file", never "skip it".
+
+    Args:
+        path (Path): Markdown file
+
+    Returns:
+        ScanResult: Fields found in the file
+    """
+    content = path.read_bytes()
+    result = ScanResult()
+
+    # One pass over the file: the first occurrence of each field is kept
+    has_username = False
+    status_end = None
+    for match in REGEX_SCAN_FIELDS_B.finditer(content):
+        field = match.lastgroup
+        if field == 'id' and result.expected_id is None:
+            result.expected_id = int(match.group('id'))
+        elif field == 'type' and result.entity_type is None:
+            result.entity_type = match.group('type').decode('utf-8')
+        elif field == 'username':
+            has_username = True
+        elif field == 'status' and status_end is None:
+            status_end = match.end()
+        if result.expected_id is not None and result.entity_type is not None and status_end is not None:
+            break
+
+    result.has_identifier = result.expected_id is not None or has_username
+
+    if status_end is not None:
+        result.last_status, result.last_datetime = _read_status_block(content, status_end)
+
+    return result
+
+
+def _scan_md_fast_safe(path):
+    # Module level to be picklable: errors are left to the full parser
+    try:
+        return scan_md_fast(path)
+    except OSError:
+        return None
+
+
+def iter_scan_md_fast(md_files):
+    """
+    Yields (md_file, ScanResult or None) for each file, in order.
+
+    Files unchanged since a previous run are read from the scan cache, without being opened.
+    From PRESCAN_PROCESSES_MIN_FILES files to scan, the scans run ahead in worker processes,
+    while the caller handles the previous files (and waits for Telegram).
+
+    Args:
+        md_files (list): Markdown files
+    """
+    cache = ScanCache()
+    try:
+        cached = {}
+        keys = {}
+        for md_file in md_files:
+            try:
+                keys[md_file] = key = ScanCache.file_key(md_file)
+            except OSError:
+                continue
+            result = cache.get(key)
+            if result is not None:
+                cached[md_file] = ScanResult(*result)
+        to_scan = [md_file for md_file in md_files if md_file not in cached]
+
+        executor = None
+        if len(to_scan) < PRESCAN_PROCESSES_MIN_FILES:
+            scans = zip(to_scan, map(_scan_md_fast_safe, to_scan))
+        else:
+            # Spawned, not forked: the caller may run other threads (progress bar, log writer, checks)
+            executor = ProcessPoolExecutor(mp_context=multiprocessing.get_context('spawn'))
+            scans = zip(to_scan, executor.map(_scan_md_fast_safe, to_scan, chunksize=64))
+
+        try:
+            for md_file in md_files:
+                if md_file in cached:
+                    yield md_file, cached[md_file]
+                    continue
+                _, scan = next(scans)
+                if scan is not None and md_file in keys:
+                    cache.put(keys[md_file], *astuple(scan))
+                yield md_file, scan
+        finally:
+            if executor:
+                executor.shutdown(wait=False, cancel_futures=True)
+    finally:
+        cache.close()
@@ -0,0 +1,80 @@
+import os
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+from telegram_checker.config.constants import SCAN_CACHE_FILE
+
+
+class ScanCache:
+    """
+    On-disk cache of the pre-scan results (see scan_md_fast()), shared between runs.
+
+    Entries are keyed by file path, and only used while the file's modification time
+    and size are unchanged: a file updated in between (by a check, or by hand) is scanned again.
+    New results are saved on close().
+    """
+
+    def __init__(self, path=SCAN_CACHE_FILE):
+        self.path = Path(path)
+        self._db = None
+        self._entries = None
+        self._pending = []
+
+    def _connect(self):
+        if self._db is None:
+            self.path.parent.mkdir(exist_ok=True)
+            # Used by whichever thread runs the scan, one at a time
+            self._db = sqlite3.connect(self.path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS scan_cache("
+                "path TEXT PRIMARY KEY, mtime_ns INTEGER, size INTEGER, expected_id INTEGER, "
+                "entity_type TEXT, has_identifier INTEGER, last_status TEXT, last_datetime TEXT)"
+            )
+        return self._db
+
+    @staticmethod
+    def file_key(md_file):
+        """
+        Returns:
+            tuple: (path, mtime_ns, size) of the file
+        """
+        st = os.stat(md_file)
+        return str(md_file), st.st_mtime_ns, st.st_size
+
+    def get(self, key):
+        """
+        Args:
+            key (tuple): File key, from file_key()
+
+        Returns:
+            tuple: (expected_id, entity_type, has_identifier, last_status, last_datetime), or None if not cached
+        """
+        if self._entries is None:
+            self._entries = {
+                row[0]: row[1:]
+                for row in self._connect().execute("SELECT * FROM scan_cache")
+            }
+        row = self._entries.get(key[0])
+        if row is None or tuple(row[:2]) != key[1:]:
+            return None
+        expected_id, entity_type, has_identifier, last_status, last_datetime = row[2:]
+        return (
+            expected_id, entity_type, bool(has_identifier), last_status,
+            datetime.fromisoformat(last_datetime) if last_datetime else None
+        )
+
+    def put(self, key, expected_id, entity_type, has_identifier, last_status, last_datetime):
+        self._pending.append((
+            *key, expected_id, entity_type, int(has_identifier), last_status,
+            last_datetime.isoformat() if last_datetime else None
+        ))
+
+    def close(self):
+        if self._pending:
+            with self._connect():
+                self._db.executemany("INSERT OR REPLACE INTO scan_cache VALUES (?, ?, ?, ?, ?, ?, ?, ?)", self._pending)
+            self._pending = []
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+        self._entries = None
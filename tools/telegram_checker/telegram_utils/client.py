@@ -1,6 +1,9 @@
+import signal
+import asyncio
+from time import monotonic
 from pathlib import Path
 from telegram_checker.config.constants import EMOJI
-from telegram_checker.config.api import API_ID, API_HASH
+from telegram_checker.config.api import load_api_credentials
 from telethon.sync import TelegramClient
 from telegram_checker.telegram_utils.exceptions import TelegramUtilsClientError
 from telegram_checker.utils.logger import get_logger
@@ -26,7 +29,7 @@ def connect_to_telegram(user):
     session_file = session_dir / user
     LOG.info(f"User: {user}", EMOJI["handle"])
     LOG.info("Connecting to Telegram...", EMOJI["connecting"])
-    client = TelegramClient(str(session_file), API_ID, API_HASH)
+    client = TelegramClient(str(session_file), *load_api_credentials())
     try:
         client.start(phone=phone)
     except Exception as e:
@@ -40,3 +43,78 @@ def connect_to_telegram(user):
 
     LOG.info("Connected!\n", EMOJI["success"])
     return client
+
+
+def run_async(client, coro):
+    """
+    Runs a coroutine on the client's event loop and returns its result.
+
+    The client is started through telethon.sync, so its connection lives on client.loop:
+    coroutines using the native async API must run on that same loop.
+    On CTRL+C, the coroutine is cancelled before the interruption is propagated.
+    """
+    task = client.loop.create_task(coro)
+    try:
+        return client.loop.run_until_complete(task)
+    except KeyboardInterrupt:
+        task.cancel()
+        try:
+            client.loop.run_until_complete(task)
+        except BaseException:
+            pass
+        raise
+
+
+class SkipOnInterrupt:
+    """
+    CTRL+C handling of concurrent tasks, as in the sequential loops: while active (with statement),
+    a first CTRL+C skips the tasks in progress (those awaiting through run()),
+    and a second one within 2 seconds interrupts everything (KeyboardInterrupt).
+    Must be entered from the main thread.
+    """
+
+    def __init__(self, loop):
+        self.loop = loop
+        self._running = set()
+        self._skipped = set()
+        self._interrupted_at = 0.0
+        self._default_handler = None
+
+    def __enter__(self):
+        self._default_handler = signal.signal(signal.SIGINT, self._on_interrupt)
+        return self
+
+    def __exit__(self, *exc_info):
+        signal.signal(signal.SIGINT, self._default_handler)
+
+    def _on_interrupt(self, signum, frame):
+        if monotonic() - self._interrupted_at < 2:
+            raise KeyboardInterrupt
+        self._interrupted_at = monotonic()
+        LOG.info('CTRL+C detected. Entity skipped by user. Press CTRL+C again to quit.', emoji=EMOJI['skip'])
+        self.loop.call_soon_threadsafe(self._skip)
+
+    def _skip(self):
+        for task in self._running:
+            self._skipped.add(task)
+            task.cancel()
+
+    async def run(self, coro):
+        """
+        Awaits a coroutine in the current task.
+
+        Returns:
+            bool: True if the coroutine was skipped by the user
+        """
+        task = asyncio.current_task()
+        self._running.add(task)
+        try:
+            await coro
+            return False
+        except asyncio.CancelledError:
+            if task not in self._skipped:
+                raise
+            task.uncancel()
+            return True
+        finally:
+            self._running.discard(task)
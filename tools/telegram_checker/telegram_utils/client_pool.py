@@ -0,0 +1,89 @@
+import asyncio
+from contextlib import asynccontextmanager
+from telegram_checker.telegram_utils.client import connect_to_telegram
+from telegram_checker.telegram_utils.rate_limiter import load_rate_limiter, save_rate_limiter
+
+
+class ClientPool:
+    """
+    Pool of connected Telegram clients (one per user session), served in round-robin.
+
+    Each client has its own rate limiter, so that a FloodWait on one account
+    doesn't slow the others down.
+    """
+
+    def __init__(self, clients, users):
+        self.clients = list(clients)
+        self.users = list(users)
+        self._idle = None
+        for client, user in zip(self.clients, self.users):
+            load_rate_limiter(client, user)
+
+    def __len__(self):
+        return len(self.clients)
+
+    @classmethod
+    def connect(cls, users, client=None):
+        """
+        Connects every user of the list and returns the pool.
+
+        Args:
+            users (list): User session names
+            client: Already connected client of the first user
+
+        Returns:
+            ClientPool: Connected pool
+        """
+        clients = [client] if client else []
+        try:
+            for user in users[len(clients):]:
+                clients.append(connect_to_telegram(user))
+        except:
+            for connected in clients[1 if client else 0:]:
+                try:
+                    connected.disconnect()
+                except:
+                    pass
+            raise
+        return cls(clients, users)
+
+    def disconnect(self):
+        for client, user in zip(self.clients, self.users):
+            try:
+                save_rate_limiter(client, user)
+            except OSError:
+                pass
+            try:
+                client.disconnect()
+            except:
+                pass
+
+    def _queue(self):
+        # Created on first use, from within the clients' event loop
+        if self._idle is None:
+            self._idle = asyncio.Queue()
+            for client in self.clients:
+                self._idle.put_nowait(client)
+        return self._idle
+
+    @asynccontextmanager
+    async def with_client(self):
+        """Waits for the least recently used client, and gives it back to the pool on exit."""
+        client = await self._queue().get()
+        try:
+            yield client
+        finally:
+            self._queue().put_nowait(client)
+
+    @asynccontextmanager
+    async def with_spare_client(self):
+        """Same as with_client(), but yields None instead of waiting if every client is busy."""
+        try:
+            client = self._queue().get_nowait()
+        except asyncio.QueueEmpty:
+            yield None
+            return
+        try:
+            yield client
+        finally:
+            self._queue().put_nowait(client)
@@ -0,0 +1,133 @@
+import json
+import sqlite3
+from time import time
+from datetime import datetime
+from pathlib import Path
+from telegram_checker.config.constants import ENTITY_CACHE_FILE, ENTITY_MEMORY_CACHE_SIZE
+
+
+class EntityCache:
+    """
+    On-disk cache of entity check results (SQLite), shared between runs.
+
+    Entries are only read back if they are younger than `ttl` seconds.
+    Without ttl, results are still stored for later runs, but never read.
+    Results of the current run are also kept in memory, and read back whatever the ttl
+    (an identifier found in several files is only checked once).
+    When disabled (--no-cache), nothing is read back.
+    Results are returned with the date and time of their check, so that a cached status is never dated as a new check.
+    """
+    # Statuses worth caching: errors and 'unknown' are always re-checked
+    CACHED_STATUSES = ('active', 'banned', 'deleted', 'id_mismatch')
+    # Kept in memory for the run: 'id_mismatch' is left out, to be confirmed by the other accounts of the pool
+    MEMORY_CACHED_STATUSES = ('active', 'banned', 'deleted')
+
+    def __init__(self, path=ENTITY_CACHE_FILE, ttl=None, enabled=True):
+        self.path = Path(path)
+        self.ttl = ttl
+        self.enabled = enabled
+        self._db = None
+        self._memory = {}
+
+    @staticmethod
+    def format_checked_at(timestamp):
+        # Same format as the status entries (see get_date_time())
+        return datetime.fromtimestamp(timestamp).strftime('%Y-%m-%d %H:%M')
+
+    @staticmethod
+    def make_key(expected_id, identifier, is_invite):
+        return f"{expected_id}|{identifier}|{is_invite}"
+
+    def _connect(self):
+        if self._db is None:
+            self.path.parent.mkdir(exist_ok=True)
+            self._db = sqlite3.connect(self.path, isolation_level=None)
+            # One small write per check: a write-ahead log avoids rewriting (and syncing) the database each time
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("PRAGMA synchronous=NORMAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS entity_cache("
+                "key TEXT PRIMARY KEY, status TEXT, restriction_details TEXT, "
+                "entity_id INTEGER, username TEXT, method TEXT, checked_at INTEGER)"
+            )
+        return self._db
+
+    def get(self, expected_id, identifier, is_invite):
+        """
+        Returns:
+            tuple: (status, restriction_details, actual_id, actual_username, method_used, checked_at), or None if not cached
+        """
+        if not self.enabled:
+            return None
+        key = self.make_key(expected_id, identifier, is_invite)
+        if key in self._memory:
+            return self._memory[key]
+        if not self.ttl:
+            return None
+        row = self._connect().execute(
+            "SELECT status, restriction_details, entity_id, username, method, checked_at FROM entity_cache "
+            "WHERE key = ? AND checked_at > ?",
+            (key, int(time()) - self.ttl)
+        ).fetchone()
+        if row is None:
+            return None
+        status, restriction_details, entity_id, username, method, checked_at = row
+        return (
+            status, json.loads(restriction_details) if restriction_details else None,
+            entity_id, username, method, self.format_checked_at(checked_at)
+        )
+
+    def put(self, expected_id, identifier, is_invite, result):
+        status, restriction_details, actual_id, actual_username, method_used = result
+        if status not in self.CACHED_STATUSES:
+            return
+        key = self.make_key(expected_id, identifier, is_invite)
+        checked_at = int(time())
+        if status in self.MEMORY_CACHED_STATUSES:
+            if len(self._memory) >= ENTITY_MEMORY_CACHE_SIZE:
+                # Oldest entry first
+                del self._memory[next(iter(self._memory))]
+            self._memory[key] = (*result, self.format_checked_at(checked_at))
+        self._connect().execute(
+            "INSERT OR REPLACE INTO entity_cache VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (
+                key, status,
+                json.dumps(restriction_details) if restriction_details else None,
+                actual_id, actual_username, method_used, checked_at
+            )
+        )
+
+    def invalidate(self, expected_id, identifiers, is_invite):
+        """Removes every entry of an entity (by ID, and by each of its identifiers)."""
+        if identifiers is None:
+            identifiers = []
+        elif not isinstance(identifiers, list):
+            identifiers = [identifiers]
+        keys = [self.make_key(expected_id, None, False)]
+        keys += [self.make_key(expected_id, identifier, is_invite) for identifier in identifiers]
+        for key in keys:
+            self._memory.pop(key, None)
+        self._connect().executemany("DELETE FROM entity_cache WHERE key = ?", [(key,) for key in keys])
+
+    def close(self):
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+
+# Global singleton instance
+_cache_instance = None
+
+def get_entity_cache():
+    """Get the global entity cache instance"""
+    global _cache_instance
+    if _cache_instance is None:
+        _cache_instance = EntityCache()
+    return _cache_instance
+
+def init_entity_cache(ttl=None, enabled=True):
+    """Initialize or reconfigure the global entity cache"""
+    cache = get_entity_cache()
+    cache.ttl = ttl
+    cache.enabled = enabled
+    return cache
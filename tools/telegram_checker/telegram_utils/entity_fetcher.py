@@ -1,9 +1,10 @@
+from collections import Counter
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
 from inspect import currentframe
 from time import sleep
-from telegram_checker.config.constants import EMOJI, MDML_BOOL_TRUE_SET, MDML_BOOL_FALSE_SET
+from telegram_checker.config.constants import EMOJI, EMOJI_FILE, EMOJI_SKIP, EMOJI_INFO, MDML_BOOL_TRUE_SET, MDML_BOOL_FALSE_SET
 from telethon.errors import (
     InviteHashExpiredError,
     InviteHashInvalidError,
@@ -15,17 +16,11 @@ from telethon.tl.types import (
     Channel, User, Chat, PeerChannel, PeerUser, PeerChat,
     ChannelParticipantsAdmins, ChannelParticipantCreator, ChannelParticipantAdmin
 )
-from telegram_checker.mdml_utils.mdml_parser import get_last_status, extract_telegram_identifiers
+from telegram_checker.mdml_utils.mdml_parser import get_last_status, extract_all, iter_scan_md_fast, load_entity
 from telegram_checker.utils.exceptions import DebugException
 from telegram_checker.utils.helpers import print_debug, seconds_to_time
-from telegram_checker.utils.logger import get_logger
-from telegram_mdml.telegram_mdml import (
-    TelegramMDMLError,
-    TelegramEntity,
-    InvalidTypeError,
-    MissingFieldError,
-    InvalidFieldError
-)
+from telegram_checker.utils.logger import get_logger, LogBuffer
+from telegram_mdml.telegram_mdml import TelegramMDMLError
 
 LOG = get_logger()
 
@@ -40,7 +35,18 @@ class SkipReasonType(Enum):
     NO_SKIP         = 'no_skip_unknown'
 
 
-@dataclass
+# Stats counter of each kind of skip
+SKIP_STATS_KEYS = {
+    SkipReasonType.STATUS_TIME:     'skipped_time',
+    SkipReasonType.STATUS:          'skipped_status',
+    SkipReasonType.FIELD_TIME:      'skipped_field',
+    SkipReasonType.FIELD_EXISTS:    'skipped_field',
+    SkipReasonType.FIELD_VALUE:     'skipped_field',
+    SkipReasonType.FIELD_VALUE_INV: 'skipped_field',
+}
+
+
+@dataclass(slots=True)
 class SkipReason:
     type: SkipReasonType
     message: str
@@ -355,33 +361,20 @@ def fetch_entity_info(client, identifier: str):
         return None
 
 
-def should_skip_entity(entity, skip_statuses, no_skip_unknown=False, skip_by_check=True, skip_time_seconds=None, skip_fields:list[dict[str, (str or SkipReasonType or any)]]=None) -> (bool, SkipReason or None):
+def should_skip_status(last_state, last_datetime, skip_statuses, no_skip_unknown=False, skip_by_check=True, skip_time_seconds=None) -> (bool, SkipReason or None):
     """
-    Determines if an entity should be skipped based on its last status.
-
-    :param entity: (TelegramEntity): Telegram MDML entity
-    :param skip_statuses: (list or None): Skip if last status is in this list
-    :param no_skip_unknown: (default: False): Don't skip when last_stats is Unknown
-    :param skip_by_check:
-    :param skip_time_seconds:
-    :param skip_fields: additional fields for skip reasons
-        - field_name: str
-        - skip_reason: SkipReasonType
-        - check_value: value to check against
+    Status part of should_skip_entity(), shared with the fast pre-scan of iter_md_entities().
 
     Returns:
-        tuple: (should_skip, reason: SkipReason or None) where reason explains why it was skipped
+        tuple: (should_skip, reason: SkipReason or None), reason being None if the status doesn't decide
     """
-
-    last_state, last_datetime, has_state_block = get_last_status(entity)
-
     if last_state is None:
         # No previous status, don't skip
         return False, None
 
     # Check if we should skip based on status
     if skip_statuses and last_state in skip_statuses:
-        return True, SkipReason(SkipReasonType.STATUS, f"last status '{last_state}' in {skip_statuses!r}")
+        return True, SkipReason(SkipReasonType.STATUS, f"last status '{last_state}' in {sorted(skip_statuses)!r}")
 
     # Exceptions with unknown
     if last_state == "unknown" and no_skip_unknown:
@@ -394,6 +387,35 @@ def should_skip_entity(entity, skip_statuses, no_skip_unknown=False, skip_by_che
         if time_since_check.total_seconds() < skip_time_seconds:
             return True, SkipReason(SkipReasonType.STATUS_TIME, f"checked {seconds_to_time(time_since_check.total_seconds())} ago (status: {last_state})")
 
+    return False, None
+
+
+def should_skip_entity(entity, skip_statuses, no_skip_unknown=False, skip_by_check=True, skip_time_seconds=None, skip_fields:list[dict[str, (str or SkipReasonType or any)]]=None) -> (bool, SkipReason or None):
+    """
+    Determines if an entity should be skipped based on its last status.
+
+    :param entity: (TelegramEntity): Telegram MDML entity
+    :param skip_statuses: (list or None): Skip if last status is in this list
+    :param no_skip_unknown: (default: False): Don't skip when last_stats is Unknown
+    :param skip_by_check:
+    :param skip_time_seconds:
+    :param skip_fields: additional fields for skip reasons
+        - field_name: str
+        - skip_reason: SkipReasonType
+        - check_value: value to check against
+
+    Returns:
+        tuple: (should_skip, reason: SkipReason or None) where reason explains why it was skipped
+    """
+
+    last_state, last_datetime, has_state_block = get_last_status(entity)
+
+    should_skip, reason = should_skip_status(
+        last_state, last_datetime, skip_statuses, no_skip_unknown, skip_by_check, skip_time_seconds
+    )
+    if should_skip or reason or last_state is None:
+        return should_skip, reason
+
     if skip_fields:
         for skip_field in skip_fields:
             fv = entity.get_field_last(skip_field['field_name'])
@@ -427,120 +449,148 @@ def should_skip_entity(entity, skip_statuses, no_skip_unknown=False, skip_by_che
     return False, None
 
 
+def _count_skip(stats, skip_reason, log=LOG):
+    """Logs a skip decided by should_skip_status() / should_skip_entity() and updates stats."""
+    log.info(f"Skipped: {skip_reason}", padding=2, emoji=EMOJI_SKIP)
+    stats['skipped'] += 1
+    if isinstance(skip_reason, SkipReason) and skip_reason.type in SKIP_STATS_KEYS:
+        stats[SKIP_STATS_KEYS[skip_reason.type]] += 1
+
+
+def _skip_type(stats, entity_type, types, log=LOG):
+    stats['skipped'] += 1
+    stats['skipped_type'] += 1
+    log.info(
+        f"Skipped: entity type {entity_type} not {', neither '.join(types)}",
+        emoji=EMOJI_SKIP,
+        padding=2
+    )
+
+
+def _read_md_entity(md_file, scan, args, types, skip_statuses, stats, log, skip_time_seconds, skip_fields):
+    """
+    Parses, filters, and skip-checks one MD file (see iter_md_entities()).
+
+    Returns:
+        dict: Everything pre-extracted for full_check / mass_report, or None if the file is skipped
+    """
+    skip_by_check = skip_fields is None
+    try:
+        log.info()
+        log.info(f"\\[[{md_file.name}\\]]", EMOJI_FILE)
+
+        # Fast pre-scan: skip without parsing the whole entity when the raw fields are enough to decide
+        if scan and scan.has_identifier:
+            if types and scan.entity_type and scan.entity_type not in types:
+                _skip_type(stats, scan.entity_type, args.type, log)
+                return None
+            should_skip, skip_reason = should_skip_status(
+                scan.last_status,
+                scan.last_datetime,
+                skip_statuses,
+                args.no_skip_unknown,
+                skip_by_check=skip_by_check,
+                skip_time_seconds=skip_time_seconds
+            )
+            if should_skip:
+                _count_skip(stats, skip_reason, log)
+                return None
+
+        entity = load_entity(md_file)
+
+        facts = extract_all(entity, log)
+
+        # Type filter
+        if types and facts.entity_type not in types:
+            _skip_type(stats, facts.entity_type, args.type, log)
+            return None
+
+        if not facts.expected_id and not facts.identifiers:
+            log.info(f"  {EMOJI_SKIP} Skipped: No identifier found")
+            stats['skipped'] += 1
+            stats['skipped_no_identifier'] += 1
+            return None
+
+        # Skip logic
+        should_skip, skip_reason = should_skip_entity(
+            entity,
+            skip_statuses,
+            args.no_skip_unknown,
+            skip_time_seconds=skip_time_seconds,
+            skip_by_check=skip_by_check,
+            skip_fields=skip_fields
+        )
+        if should_skip:
+            _count_skip(stats, skip_reason, log)
+            return None
+        elif skip_reason:
+            log.info(f"Not skipping: {skip_reason}", padding=2, emoji=EMOJI_INFO)
+
+        return {
+            'md_file':          md_file,
+            'entity':           entity,
+            'expected_id':      facts.expected_id,
+            'identifiers':      facts.identifiers,
+            'is_invite':        facts.is_invite,
+            'last_status':      facts.last_status,
+            'last_datetime':    facts.last_datetime,
+            'has_status_block': facts.has_status_block,
+        }
+
+    except FileNotFoundError:
+        stats['skipped'] += 1
+        stats['skipped_error'] += 1
+        log.error("File not found.", EMOJI['error'])
+    except TelegramMDMLError:
+        stats['skipped'] += 1
+        stats['skipped_error'] += 1
+        log.error("Parsing failed.", EMOJI['error'])
+    except Exception as e:
+        stats['skipped'] += 1
+        stats['skipped_error'] += 1
+        log.error("Failed to read MDML entity from file.", EMOJI['error'])
+        print_debug(e, currentframe().f_code.co_name)
+    except KeyboardInterrupt:
+        log.info('CTRL+C detected. Entity skipped by user. Press CTRL+C again to quit.', emoji=EMOJI['skip'])
+        try:
+            sleep(2)
+        except KeyboardInterrupt:
+            raise
+    return None
+
+
 def iter_md_entities(args, md_files, stats, skip_time_seconds=None, skip_fields:list[dict[str, (str or SkipReasonType or any)]]=None, progress_bar=None):
     """
     Parse, filter, and skip-check each MD file.
     Yields a dict with everything pre-extracted for full_check / mass_report.
     Increments stats['skipped'] and sub-keys on skip.
     """
-    for md_file in md_files:
+    # Loop invariants: sets for membership tests
+    types = frozenset(args.type) if args.type else None
+    skip_statuses = frozenset(args.skip) if args.skip else None
+
+    for md_file, scan in iter_scan_md_fast(md_files):
         if progress_bar:
             progress_bar['bar'].update(progress_bar['task'], entity=md_file.stem)
             progress_bar['bar'].advance(progress_bar['task'])
-        try:
-            entity = TelegramEntity.from_file(md_file)
-            LOG.info()
-            LOG.info(f"\\[[{md_file.name}\\]]", EMOJI["file"])
+        item = _read_md_entity(md_file, scan, args, types, skip_statuses, stats, LOG, skip_time_seconds, skip_fields)
+        if item:
+            yield item
 
-            # Type filter
-            try:
-                entity_type = entity.get_type()
-            except (InvalidTypeError, MissingFieldError):
-                entity_type = None
-            except Exception as e:
-                LOG.error(f"{EMOJI['error']} Error: {e}")
-                entity_type = None
-
-            if args.type and entity_type not in args.type:
-                stats['skipped'] += 1
-                stats['skipped_type'] += 1
-                LOG.info(
-                    f"Skipped: entity type {entity_type} not {', neither '.join(args.type)}",
-                    emoji=EMOJI['skip'],
-                    padding=2
-                )
-                continue
-
-            # Identifiers
-            try:
-                expected_id = entity.get_id()
-            except InvalidFieldError:
-                expected_id = None
-            except Exception as e:
-                LOG.error(f"{EMOJI['error']} Error: {e}")
-                expected_id = None
 
-            identifiers, is_invite = extract_telegram_identifiers(entity)
+def iter_md_entities_deferred(args, md_files, skip_time_seconds=None, skip_fields:list[dict[str, (str or SkipReasonType or any)]]=None):
+    """
+    iter_md_entities(), for files read ahead of their checks (e.g. in another thread):
+    nothing is logged nor counted, and every file is yielded, skipped or not.
 
-            if not expected_id and not identifiers:
-                LOG.info(f"  {EMOJI['skip']} Skipped: No identifier found")
-                stats['skipped'] += 1
-                stats['skipped_no_identifier'] += 1
-                continue
+    Yields:
+        tuple: (md_file, item or None if skipped, LogBuffer of the file's output, Counter of its stats),
+               the output to be replayed and the stats to be added by the caller
+    """
+    types = frozenset(args.type) if args.type else None
+    skip_statuses = frozenset(args.skip) if args.skip else None
 
-            # Skip logic
-            should_skip, skip_reason = should_skip_entity(
-                entity,
-                args.skip,
-                args.no_skip_unknown,
-                skip_time_seconds=skip_time_seconds,
-                skip_by_check=(skip_fields is None),
-                skip_fields=skip_fields
-            )
-            if should_skip:
-                LOG.info(f"Skipped: {skip_reason}", padding=2, emoji=EMOJI['skip'])
-                stats['skipped'] += 1
-                if isinstance(skip_reason, SkipReason):
-                    if skip_reason.type == SkipReasonType.STATUS_TIME:
-                        stats['skipped_time'] += 1
-                    elif skip_reason.type == SkipReasonType.STATUS:
-                        stats['skipped_status'] += 1
-                    elif skip_reason.type in (SkipReasonType.FIELD_TIME, SkipReasonType.FIELD_EXISTS, SkipReasonType.FIELD_VALUE):
-                        stats['skipped_field'] += 1
-                continue
-            elif skip_reason:
-                LOG.info(f"Not skipping: {skip_reason}", padding=2, emoji=EMOJI['info'])
-
-            last_status, last_datetime, has_status_block = get_last_status(entity)
-
-            identifiers_list = None
-            if is_invite:
-                identifiers_list = ['+' + ident if ident[0] != '+' else ident for ident in identifiers]
-            elif isinstance(identifiers, list):
-                # Not invite. List of usernames
-                identifiers_list = identifiers
-            elif isinstance(identifiers, str):
-                # Not invite, one username as string
-                identifiers_list = [identifiers]
-
-            yield {
-                'md_file':          md_file,
-                'entity':           entity,
-                'expected_id':      expected_id,
-                'identifiers':      identifiers_list,
-                'is_invite':        is_invite,
-                'last_status':      last_status,
-                'last_datetime':    last_datetime,
-                'has_status_block': has_status_block,
-            }
-
-        except FileNotFoundError:
-            stats['skipped'] += 1
-            stats['skipped_error'] = stats.get('skipped_error', 0) + 1
-            LOG.error("File not found.", EMOJI['error'])
-        except TelegramMDMLError:
-            stats['skipped'] += 1
-            stats['skipped_error'] = stats.get('skipped_error', 0) + 1
-            LOG.error("Parsing failed.", EMOJI['error'])
-        except Exception as e:
-            stats['skipped'] += 1
-            stats['skipped_error'] = stats.get('skipped_error', 0) + 1
-            LOG.error("Failed to read MDML entity from file.", EMOJI['error'])
-            print_debug(e, currentframe().f_code.co_name)
-        except KeyboardInterrupt:
-            LOG.info('CTRL+C detected. Entity skipped by user. Press CTRL+C again to quit.', emoji=EMOJI['skip'])
-            try:
-                sleep(2)
-            except KeyboardInterrupt:
-                raise
-            continue
+    for md_file, scan in iter_scan_md_fast(md_files):
+        log, file_stats = LogBuffer(), Counter()
+        item = _read_md_entity(md_file, scan, args, types, skip_statuses, file_stats, log, skip_time_seconds, skip_fields)
+        yield md_file, item, log, file_stats
@@ -0,0 +1,103 @@
+import json
+import asyncio
+from time import monotonic
+from random import randint
+from pathlib import Path
+from telegram_checker.config.api import (
+    SLEEP_BETWEEN_CHECKS,
+    RATE_LIMIT_MIN,
+    RATE_LIMIT_MAX,
+    RATE_LIMIT_BURST,
+    RATE_INCREASE_AFTER,
+    RATE_FILE
+)
+
+
+class RateLimiter:
+    """
+    Adaptive token bucket, one per account.
+
+    Tokens are refilled at `rate` tokens per second, up to `burst`.
+    The rate is halved on FloodWait, and raised by 10% after RATE_INCREASE_AFTER
+    calls in a row without FloodWait, within [RATE_LIMIT_MIN, RATE_LIMIT_MAX].
+    After a FloodWait, no call is allowed until the wait is over, for every task using the account.
+    """
+
+    def __init__(self, rate=1 / SLEEP_BETWEEN_CHECKS, burst=RATE_LIMIT_BURST):
+        self.rate = min(max(rate, RATE_LIMIT_MIN), RATE_LIMIT_MAX)
+        self.burst = burst
+        self.tokens = 1
+        self._updated_at = monotonic()
+        self._successes = 0
+        self._resume_at = 0
+        self._lock = None
+
+    def _refill(self):
+        now = monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+
+    async def acquire(self, cost=1):
+        """Waits until a call costing `cost` tokens is allowed."""
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            # Paused by a FloodWait
+            while (pause := self._resume_at - monotonic()) > 0:
+                await asyncio.sleep(pause)
+            self._refill()
+            while self.tokens < cost:
+                await asyncio.sleep((cost - self.tokens) / self.rate)
+                self._refill()
+            self.tokens -= cost
+
+    def on_success(self):
+        self._successes += 1
+        if self._successes >= RATE_INCREASE_AFTER:
+            self._successes = 0
+            self.rate = min(self.rate * 1.1, RATE_LIMIT_MAX)
+
+    def on_flood(self, seconds):
+        """
+        Halves the rate, and returns how long to wait: the FloodWait duration,
+        plus up to 10% of random jitter so that accounts don't resume all at once.
+        """
+        self._successes = 0
+        self.tokens = 0
+        self.rate = max(self.rate / 2, RATE_LIMIT_MIN)
+        wait = seconds + randint(0, seconds // 10 + 1)
+        self._resume_at = max(self._resume_at, monotonic() + wait)
+        # Tokens only start refilling once the wait is over
+        self._updated_at = self._resume_at
+        return wait
+
+
+# Limiters of the connected clients
+_limiters = {}
+
+def get_rate_limiter(client):
+    """Get the rate limiter of a client (created with the default rate if needed)"""
+    if client not in _limiters:
+        _limiters[client] = RateLimiter()
+    return _limiters[client]
+
+def load_rate_limiter(client, user):
+    """Creates the rate limiter of a client, starting from the last safe rate saved for this user"""
+    try:
+        rates = json.loads(Path(RATE_FILE).read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        rates = {}
+    _limiters[client] = RateLimiter(rates.get(user, 1 / SLEEP_BETWEEN_CHECKS))
+    return _limiters[client]
+
+def save_rate_limiter(client, user):
+    """Saves the current rate of a client for the next runs"""
+    if client not in _limiters:
+        return
+    path = Path(RATE_FILE)
+    try:
+        rates = json.loads(path.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        rates = {}
+    rates[user] = _limiters[client].rate
+    path.write_text(json.dumps(rates, indent=2), encoding='utf-8')
@@ -1,6 +1,16 @@
-from time import sleep
-from telegram_checker.config.api import SLEEP_BETWEEN_CHECKS
-from telegram_checker.config.constants import EMOJI
+import asyncio
+from telegram_checker.config.api import SLEEP_BETWEEN_CHECKS, ID_BATCH_SIZE, MAX_CHECK_RETRIES, RETRY_BACKOFF_MAX, INVITE_CONCURRENCY
+from telegram_checker.config.constants import (
+    EMOJI,
+    EMOJI_NO_EMOJI,
+    EMOJI_WARNING,
+    EMOJI_PAUSE,
+    EMOJI_CONNECTION,
+    EMOJI_ID,
+    EMOJI_FALLBACK,
+    EMOJI_INVITE,
+    EMOJI_HANDLE
+)
 from telethon.errors import (
     ChannelPrivateError,
     UsernameInvalidError,
@@ -9,17 +19,30 @@ from telethon.errors import (
     InviteHashInvalidError,
     FloodWaitError
 )
+from telethon.tl.functions.users import GetUsersRequest
+from telethon.tl.functions.channels import GetChannelsRequest
+from telethon.tl.functions.messages import CheckChatInviteRequest, GetChatsRequest
+from telethon.tl.types import (
+    ChatInviteAlready, ChatInvite, ChatInvitePeek,
+    PeerChannel, PeerUser, PeerChat,
+    InputPeerUser, InputPeerChannel, InputPeerChat,
+    InputUser, InputChannel, UserEmpty, ChatEmpty
+)
 from telegram_checker.telegram_utils.exceptions import TelegramUtilsClientError
-from telegram_checker.utils.helpers import seconds_to_time, sleep_with_progress
+from telegram_checker.telegram_utils.entity_cache import get_entity_cache
+from telegram_checker.telegram_utils.rate_limiter import get_rate_limiter
+from telegram_checker.utils.helpers import seconds_to_time, async_sleep_with_progress
 from telegram_checker.utils.logger import get_logger
 
 LOG = get_logger()
+# Negative statuses that need a second account to agree, when a pool is used
+CORROBORATED_STATUSES = ('unknown', 'id_mismatch')
 
 # ============================================
 # ENTITY STATUS CHECKING
 # ============================================
 
-def check_entity_by_id(client, entity_id):
+async def check_entity_by_id(client, entity_id):
     """
     Tries to get entity directly by ID (most reliable if client is member).
 
@@ -31,23 +54,21 @@ def check_entity_by_id(client, entity_id):
         tuple: (success, entity_or_error)
     """
     try:
-        from telethon.tl.types import PeerChannel, PeerUser, PeerChat
-
         # Try different peer types in order of likelihood
         try:
-            entity = client.get_entity(PeerChannel(entity_id))
+            entity = await client.get_entity(PeerChannel(entity_id))
             return True, entity
-        except:
+        except Exception:
             try:
-                entity = client.get_entity(PeerUser(entity_id))
+                entity = await client.get_entity(PeerUser(entity_id))
                 return True, entity
-            except:
+            except Exception:
                 try:
-                    entity = client.get_entity(PeerChat(entity_id))
+                    entity = await client.get_entity(PeerChat(entity_id))
                     return True, entity
-                except:
+                except Exception:
                     # Try direct ID as last resort
-                    entity = client.get_entity(entity_id)
+                    entity = await client.get_entity(entity_id)
                     return True, entity
 
     except ValueError as e:
@@ -61,6 +82,82 @@ def check_entity_by_id(client, entity_id):
         return False, e
 
 
+async def batch_resolve_ids(client, ids):
+    """
+    Resolves many IDs at once, with one users.getUsers / channels.getChannels /
+    messages.getChats call per chunk of ID_BATCH_SIZE, instead of one call per ID.
+
+    Only IDs known by the session (access hash) can be resolved this way;
+    the others are left to check_entity_by_id().
+
+    Args:
+        client: TelegramClient instance
+        ids (list): Entity IDs
+
+    Returns:
+        dict: {entity_id: entity} for every resolved ID
+    """
+    users, channels, chats = [], [], []
+    for entity_id in set(ids):
+        try:
+            input_peer = client.session.get_input_entity(entity_id)
+        except (ValueError, KeyError):
+            continue
+        if isinstance(input_peer, InputPeerChannel):
+            channels.append(InputChannel(input_peer.channel_id, input_peer.access_hash))
+        elif isinstance(input_peer, InputPeerUser):
+            users.append(InputUser(input_peer.user_id, input_peer.access_hash))
+        elif isinstance(input_peer, InputPeerChat):
+            chats.append(input_peer.chat_id)
+
+    resolved = {}
+    limiter = get_rate_limiter(client)
+    for peers, make_request in (
+        (channels, lambda chunk: GetChannelsRequest(chunk)),
+        (users,    lambda chunk: GetUsersRequest(chunk)),
+        (chats,    lambda chunk: GetChatsRequest(chunk)),
+    ):
+        for start in range(0, len(peers), ID_BATCH_SIZE):
+            await limiter.acquire()
+            try:
+                result = await client(make_request(peers[start:start + ID_BATCH_SIZE]))
+            except FloodWaitError as e:
+                wait = limiter.on_flood(e.seconds)
+                LOG.error(f"FloodWait: waiting {seconds_to_time(wait)}...", EMOJI_PAUSE)
+                await async_sleep_with_progress(wait, dest=LOG.error, emoji=EMOJI_PAUSE)
+                continue
+            except Exception as e:
+                # A single invalid peer fails the whole chunk: these IDs are checked one by one
+                LOG.debug(f"Batch resolution failed: {type(e).__name__}: {e}")
+                continue
+            for entity in getattr(result, 'chats', result):
+                if not isinstance(entity, (UserEmpty, ChatEmpty)):
+                    resolved[entity.id] = entity
+
+    return resolved
+
+
+async def resolve_invite(client, invite_link):
+    """
+    Checks an invite link with CheckChatInviteRequest, which neither joins nor peeks the chat
+    (lighter than get_entity() on the link).
+
+    Args:
+        client: TelegramClient instance
+        invite_link (str): Invite link (https://t.me/+HASH)
+
+    Returns:
+        The chat if it is visible (already a member, or peek preview), None if only the invite preview is visible
+    """
+    result = await client(CheckChatInviteRequest(hash=invite_link.rsplit('+', 1)[-1]))
+    if isinstance(result, (ChatInviteAlready, ChatInvitePeek)):
+        return result.chat
+    if isinstance(result, ChatInvite):
+        return None
+    # Unexpected type: let Telethon resolve the link
+    return await client.get_entity(invite_link)
+
+
 def analyze_entity_status(entity):
     """
     Analyzes an entity object to determine its status.
@@ -72,37 +169,33 @@ def analyze_entity_status(entity):
         tuple: (status, restriction_details)
     """
     # Check if user is deleted
-    if hasattr(entity, 'deleted') and entity.deleted:
+    if getattr(entity, 'deleted', False):
         return 'deleted', None
 
     # Check if entity is restricted (banned by Telegram)
-    if hasattr(entity, 'restricted') and entity.restricted:
-        if hasattr(entity, 'restriction_reason') and entity.restriction_reason:
-            for restriction in entity.restriction_reason:
-                if restriction.platform == 'all':
-                    details = {
-                        'platform': restriction.platform,
-                        'reason': restriction.reason,
-                        'text': restriction.text
-                    }
-                    return 'banned', details
-
-            # Platform-specific restriction (not global ban)
-            return 'unknown', None
-        else:
-            # Restricted but no reason provided
+    if getattr(entity, 'restricted', False):
+        # Restricted but no reason provided, or platform-specific restriction (not global ban): unknown
+        reasons = getattr(entity, 'restriction_reason', None) or ()
+        restriction = next((r for r in reasons if r.platform == 'all'), None)
+        if restriction is None:
             return 'unknown', None
+        details = {
+            'platform': restriction.platform,
+            'reason': restriction.reason,
+            'text': restriction.text
+        }
+        return 'banned', details
 
     return 'active', None
 
 
-def check_entity_status(client, identifier=None, is_invite=False, expected_id=None):
+async def check_entity_status(client, identifier=None, is_invite=False, expected_id=None):
     """
     Checks the status of a Telegram entity.
 
     Args:
         client: TelegramClient instance
-        identifier (str, optional): Username or invite hash (None if checking by ID only)
+        identifier (str, optional): Username or invite link (None if checking by ID only)
         is_invite (bool): Whether the identifier is an invitation link
         expected_id (int, optional): Expected entity ID for verification
 
@@ -122,13 +215,17 @@ def check_entity_status(client, identifier=None, is_invite=False, expected_id=No
                     invalid invite, no access, platform-specific restriction, etc.)
     """
 
+    # Invite checks are more limited by Telegram: they cost twice as much
+    limiter = get_rate_limiter(client)
+    await limiter.acquire(cost=2 if is_invite else 1)
+
     # PRIORITY 1: Try by ID first if available
     if expected_id is not None:
-        success, result = check_entity_by_id(client, expected_id)
+        success, result = await check_entity_by_id(client, expected_id)
         if success:
             entity = result
             status, restriction_details = analyze_entity_status(entity)
-            retrieved_username = entity.username if hasattr(entity, 'username') else None
+            retrieved_username = getattr(entity, 'username', None)
             return status, restriction_details, None, retrieved_username, 'id'
         # If ID fetch failed, continue to fallback methods below (if identifier provided)
 
@@ -143,24 +240,25 @@ def check_entity_status(client, identifier=None, is_invite=False, expected_id=No
     # PRIORITY 2 & 3: Try by username or invite (fallback or primary if no ID)
     try:
         if is_invite:
-            entity = client.get_entity(f'https://t.me/+{identifier}')
+            entity = await resolve_invite(client, identifier)
+            if entity is None:
+                # The invite page is visible: the entity is active, we're just not a member
+                return 'active', None, None, None, 'invite'
         else:
-            entity = client.get_entity(identifier)
+            entity = await client.get_entity(identifier)
+
+        retrieved_id = getattr(entity, 'id', None)
+        retrieved_username = getattr(entity, 'username', None)
+        method = 'invite' if is_invite else 'username'
 
         # *** SAFEGUARD: Verify ID if expected_id is provided ***
         # Only check for mismatch if we actually have an expected_id
-        if expected_id is not None and hasattr(entity, 'id'):
-            if entity.id != expected_id:
-                # This is a DIFFERENT entity with the same username/invite!
-                method = 'invite' if is_invite else 'username'
-                retrieved_username = entity.username if hasattr(entity, 'username') else None
-                return 'id_mismatch', None, entity.id, retrieved_username, method
+        if expected_id is not None and retrieved_id is not None and retrieved_id != expected_id:
+            # This is a DIFFERENT entity with the same username/invite!
+            return 'id_mismatch', None, retrieved_id, retrieved_username, method
 
         # Successfully retrieved entity - now check its status
         status, restriction_details = analyze_entity_status(entity)
-        method = 'invite' if is_invite else 'username'
-        retrieved_id = entity.id if hasattr(entity, 'id') else None
-        retrieved_username = entity.username if hasattr(entity, 'username') else None
         return status, restriction_details, retrieved_id, retrieved_username, method
 
     except ChannelPrivateError:
@@ -184,55 +282,96 @@ def check_entity_status(client, identifier=None, is_invite=False, expected_id=No
             # Therefore, the entity is active, just not accessible to us
             return 'active', None, None, None, ('invite' if is_invite else 'username')
         # Other ValueError cases
-        LOG.error(f"Unexpected ValueError: {str(e)}", EMOJI["warning"], padding=2)
+        LOG.error(f"Unexpected ValueError: {str(e)}", EMOJI_WARNING, padding=2)
         return 'unknown', None, None, None, 'error'
 
-    except FloodWaitError as e:
-        LOG.error(f"\n\nFloodWait: waiting {seconds_to_time(e.seconds)}...", EMOJI["pause"])
-        sleep_with_progress(e.seconds, dest=LOG.error, emoji=EMOJI["pause"])
-        return check_entity_status(client, identifier, is_invite, expected_id)
-
-    except ConnectionError as e:
-        LOG.error(f"\n\nConnectionError. Will wait before retrying. Use CTRL+C to quit.", EMOJI['connection'])
-        sleep_with_progress(5*SLEEP_BETWEEN_CHECKS, dest=LOG.error, emoji=EMOJI["connection"])
-        LOG.error("Retrying to connect...")
-        try:
-            client.disconnect()
-        except:
-            pass
-        try:
-            client.connect()
-        except:
-            pass
-        return check_entity_status(client, identifier, is_invite, expected_id)
+    except (FloodWaitError, ConnectionError, TimeoutError):
+        # Handled by check_entity_status_with_retry()
+        raise
 
     except Exception as e:
         if type(e).__name__ == "OperationalError":
             # ToDo: Is it good to raise an exception in this function?
             raise TelegramUtilsClientError("User is busy with another script", e)
         else:
-            LOG.error(f"Unexpected error: {type(e).__name__}: {str(e)}", EMOJI["warning"], padding=2)
+            LOG.error(f"Unexpected error: {type(e).__name__}: {str(e)}", EMOJI_WARNING, padding=2)
             return f'error_{type(e).__name__}', None, None, None, 'error'
 
 
-def check_and_display(client, identifier, is_invite, expected_id, stats, label, emoji='', padding=0):
+async def check_entity_status_with_retry(client, identifier=None, is_invite=False, expected_id=None):
     """
-    Helper function to check status and display result.
+    Same as check_entity_status(), retried in a loop (up to MAX_CHECK_RETRIES times):
+    - after a FloodWait: waits the time asked by Telegram (plus jitter), and slows the client's rate limiter down
+    - after a ConnectionError or a timeout: waits (SLEEP_BETWEEN_CHECKS, doubled after each failure,
+      up to RETRY_BACKOFF_MAX), then reconnects the client
 
     Returns:
         tuple: (status, restriction_details, actual_id, actual_username, method_used)
+               status is 'error_<ExceptionName>' once the retries are exhausted
+    """
+    limiter = get_rate_limiter(client)
+    for attempt in range(MAX_CHECK_RETRIES):
+        try:
+            return await check_entity_status(client, identifier, is_invite, expected_id)
+        except FloodWaitError as e:
+            error = e
+            wait = limiter.on_flood(e.seconds)
+            LOG.error(f"\n\nFloodWait: waiting {seconds_to_time(wait)}...", EMOJI_PAUSE)
+            await async_sleep_with_progress(wait, dest=LOG.error, emoji=EMOJI_PAUSE)
+        except (ConnectionError, TimeoutError) as e:
+            error = e
+            LOG.error(f"\n\n{type(e).__name__}. Will wait before retrying. Use CTRL+C to quit.", EMOJI_CONNECTION)
+            wait = min(SLEEP_BETWEEN_CHECKS * 2 ** attempt, RETRY_BACKOFF_MAX)
+            await async_sleep_with_progress(wait, dest=LOG.error, emoji=EMOJI_CONNECTION)
+            LOG.error("Retrying to connect...")
+            try:
+                await client.disconnect()
+            except Exception:
+                pass
+            try:
+                await client.connect()
+            except Exception:
+                pass
+
+    LOG.error(f"Giving up after {MAX_CHECK_RETRIES} retries: {type(error).__name__}", EMOJI_WARNING, padding=2)
+    return f'error_{type(error).__name__}', None, None, None, 'error'
+
+
+async def check_and_display(client, identifier, is_invite, expected_id, stats, label, emoji='', padding=0, use_cache=True):
+    """
+    Helper function to check status and display result.
+
+    Args:
+        use_cache (bool): Read recent results from the cache (results are stored either way)
+
+    Returns:
+        tuple: (status, restriction_details, actual_id, actual_username, method_used, checked_at)
+               checked_at being the date and time of a cached result's check, None if just checked
     """
     LOG.info(f"{label}...", end='\n', flush=True, padding=padding, emoji=emoji)  # end = ' ' ?
-    status, restriction_details, actual_id, actual_username, method_used = check_entity_status(
+
+    # Recent results are read from the cache, without querying Telegram
+    cache = get_entity_cache()
+    cached = cache.get(expected_id, identifier, is_invite) if use_cache else None
+    if cached:
+        status, restriction_details, actual_id, actual_username, method_used, checked_at = cached
+        stats['method']['cache'] += 1
+        LOG.info(f"{status} (cached, checked {checked_at})", padding=padding, emoji=EMOJI.get(status, EMOJI_NO_EMOJI))
+        return cached
+
+    status, restriction_details, actual_id, actual_username, method_used = await check_entity_status_with_retry(
         client, identifier, is_invite, expected_id
     )
+    cache.put(expected_id, identifier, is_invite, (status, restriction_details, actual_id, actual_username, method_used))
+    if not status.startswith('error_'):
+        get_rate_limiter(client).on_success()
 
     if method_used in stats['method']:
         stats['method'][method_used] += 1
 
-    LOG.info(status, padding=padding, emoji=EMOJI.get(status, EMOJI["no_emoji"]))
+    LOG.info(status, padding=padding, emoji=EMOJI.get(status, EMOJI_NO_EMOJI))
 
-    return status, restriction_details, actual_id, actual_username, method_used
+    return status, restriction_details, actual_id, actual_username, method_used, None
 
 
 def format_display_id(expected_id, identifiers, method_used):
@@ -246,26 +385,27 @@ def format_display_id(expected_id, identifiers, method_used):
         return f"ID:{expected_id}"
     elif method_used == 'invite':
         invite_list = identifiers if isinstance(identifiers, list) else [identifiers]
-        return f"+{invite_list[0][:10]}... ({len(invite_list)} invite(s))"
+        return f"{invite_list[0].removeprefix('https://t.me/')[:11]}... ({len(invite_list)} invite(s))"
     elif method_used == 'username':
-        return f"@{identifiers}"
+        return f"@{identifiers[0] if isinstance(identifiers, list) else identifiers}"
     else:
         return "???"
 
 
-def check_entity_with_fallback(client, expected_id, identifiers, is_invite, stats):
+async def check_entity_with_fallback(client, expected_id, identifiers, is_invite, stats, use_cache=True):
     """
     Checks entity status with priority fallback: ID → Invites → Username.
 
     Args:
         client: TelegramClient instance
         expected_id: Entity ID (or None)
-        identifiers: Username or list of invite hashes (or None)
+        identifiers: Username or list of invite links (or None)
         is_invite: Whether identifiers are invite links
         stats: Statistics dictionary to update
+        use_cache: Read recent results from the cache (False to always query Telegram)
 
     Returns:
-        tuple: (status, restriction_details, actual_id, actual_username, method_used, display_id)
+        tuple: (status, restriction_details, actual_id, actual_username, method_used, display_id, checked_at)
 
     # ToDo: Handle list() identifiers in all cases, and try multiple usernames (like actual multiple invites)
     """
@@ -274,67 +414,85 @@ def check_entity_with_fallback(client, expected_id, identifiers, is_invite, stat
     actual_id = None
     actual_username = None
     method_used = None
+    checked_at = None
 
     # PRIORITY 1: Try by ID first (most reliable)
     if expected_id:
-        status, restriction_details, actual_id, actual_username, method_used = check_and_display(
+        status, restriction_details, actual_id, actual_username, method_used, checked_at = await check_and_display(
             client, None, False, expected_id,
             label=f"Checking by ID: {expected_id}",
             padding=2,
             stats=stats,
-            emoji=EMOJI['id']
+            emoji=EMOJI_ID,
+            use_cache=use_cache
         )
+        if status != 'unknown':
+            return status, restriction_details, actual_id, actual_username, method_used, format_display_id(expected_id, identifiers, method_used), checked_at
 
     # PRIORITY 2: Fallback to invite links (if ID failed or no ID)
-    if status is None or status == 'unknown':
-        if is_invite and identifiers:
-            invite_list = identifiers if isinstance(identifiers, list) else [identifiers]
-            LOG.info(f"  {EMOJI['fallback']} Fallback: Checking {len(invite_list)} invite(s)...")
-
-            for idx, invite_hash in enumerate(invite_list, 1):
-                status, restriction_details, actual_id, actual_username, method_used = check_and_display(
-                    client, invite_hash, True, expected_id,
-                    label=f"\\[{idx}/{len(invite_list)}\\] {invite_hash}",
-                    padding=4,
-                    emoji=EMOJI['invite'],
-                    stats=stats
-                )
+    if is_invite and identifiers:
+        invite_list = identifiers if isinstance(identifiers, list) else [identifiers]
+        LOG.info(f"  {EMOJI_FALLBACK} Fallback: Checking {len(invite_list)} invite(s)...")
 
-                if actual_id and not expected_id:
-                    LOG.info(f"ID recovered: {actual_id}", padding=6, emoji=EMOJI['id'])
+        # Invites are checked a few at a time (paced by the rate limiter), and the first definitive answer wins.
+        # The bound keeps an entity with many invites from queuing them all ahead of the other checks of the account.
+        semaphore = asyncio.Semaphore(INVITE_CONCURRENCY)
 
-                if actual_username:
-                    LOG.info(f"Username: @{actual_username}", padding=6, emoji=EMOJI['handle'])
+        async def check_invite(idx, invite_link):
+            async with semaphore:
+                return await check_and_display(
+                    client, invite_link, True, expected_id,
+                    label=f"\\[{idx}/{len(invite_list)}\\] {invite_link}",
+                    padding=4,
+                    emoji=EMOJI_INVITE,
+                    stats=stats,
+                    use_cache=use_cache
+                )
 
+        tasks = [
+            asyncio.create_task(check_invite(idx, invite_link))
+            for idx, invite_link in enumerate(invite_list, 1)
+        ]
+        try:
+            for next_result in asyncio.as_completed(tasks):
+                status, restriction_details, actual_id, actual_username, method_used, checked_at = await next_result
                 # Stop if we get a definitive answer
                 if status != 'unknown':
                     break
+        finally:
+            for task in tasks:
+                task.cancel()
+
+        if actual_id and not expected_id:
+            LOG.info(f"ID recovered: {actual_id}", padding=6, emoji=EMOJI_ID)
 
-                # Sleep between invite checks
-                if idx < len(invite_list):
-                    sleep(2*SLEEP_BETWEEN_CHECKS)
+        if actual_username:
+            LOG.info(f"Username: @{actual_username}", padding=6, emoji=EMOJI_HANDLE)
+
+        if status != 'unknown':
+            return status, restriction_details, actual_id, actual_username, method_used, format_display_id(expected_id, identifiers, method_used), checked_at
 
     # PRIORITY 3: Fallback to username (last resort)
-    if status is None or status == 'unknown':
-        if not is_invite and identifiers:
-            username = identifiers[0] if isinstance(identifiers, list) else identifiers
-
-            status, restriction_details, actual_id, actual_username, method_used = check_and_display(
-                client,
-                identifier=username,
-                is_invite=False,
-                expected_id=expected_id,
-                label=f"Fallback: Checking @{username}",
-                padding=2,
-                emoji=EMOJI['handle'],
-                stats=stats
-            )
+    if not is_invite and identifiers:
+        username = identifiers[0] if isinstance(identifiers, list) else identifiers
+
+        status, restriction_details, actual_id, actual_username, method_used, checked_at = await check_and_display(
+            client,
+            identifier=username,
+            is_invite=False,
+            expected_id=expected_id,
+            label=f"Fallback: Checking @{username}",
+            padding=2,
+            emoji=EMOJI_HANDLE,
+            stats=stats,
+            use_cache=use_cache
+        )
 
-            if actual_id and not expected_id:
-                LOG.info(f"ID recovered: {actual_id} (via username - unreliable)", padding=4, emoji=EMOJI['id'])
+        if actual_id and not expected_id:
+            LOG.info(f"ID recovered: {actual_id} (via username - unreliable)", padding=4, emoji=EMOJI_ID)
 
-            if actual_username:
-                LOG.info(f"Username: @{actual_username}", padding=4, emoji=EMOJI['handle'])
+        if actual_username:
+            LOG.info(f"Username: @{actual_username}", padding=4, emoji=EMOJI_HANDLE)
 
     # Final fallback (should rarely happen)
     if status is None:
@@ -344,6 +502,49 @@ def check_entity_with_fallback(client, expected_id, identifiers, is_invite, stat
     # Format display ID based on what succeeded
     display_id = format_display_id(expected_id, identifiers, method_used)
 
-    return status, restriction_details, actual_id, actual_username, method_used, display_id
+    return status, restriction_details, actual_id, actual_username, method_used, display_id, checked_at
+
 
+async def check_entity_with_pool(pool, expected_id, identifiers, is_invite, stats, resolved=None):
+    """
+    Checks entity status with the next available account of the pool.
+
+    A negative status (unknown, id_mismatch) is only kept if a second account,
+    when one is available, agrees: a private entity can be reachable by an account
+    that has been accepted in it. The second account always queries Telegram:
+    the cache (shared by the whole pool) would only return the first account's result.
+
+    Entities already fetched by batch_resolve_ids() (`resolved`) are analyzed
+    directly, unless their status is 'unknown'.
+
+    Returns:
+        tuple: (status, restriction_details, actual_id, actual_username, method_used, display_id, checked_at)
+               checked_at being the date and time of a cached result's check, None if just checked
+    """
+    if resolved and expected_id in resolved:
+        entity = resolved[expected_id]
+        status, restriction_details = analyze_entity_status(entity)
+        if status != 'unknown':
+            LOG.info(f"Checking by ID: {expected_id}...", padding=2, emoji=EMOJI_ID)
+            retrieved_username = getattr(entity, 'username', None)
+            get_entity_cache().put(expected_id, None, False, (status, restriction_details, None, retrieved_username, 'id'))
+            stats['method']['id'] += 1
+            LOG.info(status, padding=2, emoji=EMOJI.get(status, EMOJI_NO_EMOJI))
+            return status, restriction_details, None, retrieved_username, 'id', format_display_id(expected_id, identifiers, 'id'), None
+
+    async with pool.with_client() as client:
+        result = await check_entity_with_fallback(client, expected_id, identifiers, is_invite, stats)
+        if result[0] not in CORROBORATED_STATUSES or len(pool) < 2:
+            return result
+
+        async with pool.with_spare_client() as other_client:
+            if other_client is None:
+                return result
+            LOG.info("Confirming with another account...", padding=2, emoji=EMOJI_HANDLE)
+            other_result = await check_entity_with_fallback(
+                other_client, expected_id, identifiers, is_invite, stats, use_cache=False
+            )
 
+    if other_result[0] in CORROBORATED_STATUSES or other_result[0].startswith('error_'):
+        return result
+    return other_result
@@ -1,5 +1,4 @@
 from inspect import currentframe
-from time import sleep
 from telethon.tl.functions.messages import CheckChatInviteRequest
 from telethon.tl.types import ChatInviteAlready, ChatInvite, ChatInvitePeek
 from telethon.errors import (
@@ -11,14 +10,16 @@ from telethon.errors import (
     FloodWaitError
 )
 from telegram_checker.config.constants import EMOJI
-from telegram_checker.utils.helpers import print_debug, seconds_to_time, sleep_with_progress
+from telegram_checker.config.api import MAX_CHECK_RETRIES
+from telegram_checker.telegram_utils.rate_limiter import get_rate_limiter
+from telegram_checker.utils.helpers import print_debug, seconds_to_time, async_sleep_with_progress
 from telegram_checker.utils.logger import get_logger
 from telegram_checker.utils.exceptions import DebugException
 
 LOG = get_logger()
 
 
-def validate_invite(client, invite_hash):
+async def validate_invite(client, invite_hash):
     """
     Validates an invitation link by checking the invite info.
     Uses CheckChatInviteRequest to validate the invite,
@@ -31,57 +32,61 @@ def validate_invite(client, invite_hash):
     Returns:
         tuple: (is_valid, user_id or None, reason or None, message or None)
     """
-    try:
-        # Check the invite (returns ChatInviteAlready, ChatInvite, or ChatInvitePeek)
-        result = client(CheckChatInviteRequest(hash=invite_hash))
-
-        # Invitation is valid - now try to get the entity ID
-        entity_id = None
-        message = None
+    # Retried in a loop after each FloodWait (up to MAX_CHECK_RETRIES times)
+    for _ in range(MAX_CHECK_RETRIES):
         try:
-            entity = client.get_entity(f'https://t.me/+{invite_hash}')
-            if hasattr(entity, 'id'):
-                entity_id = entity.id
+            # Check the invite (returns ChatInviteAlready, ChatInvite, or ChatInvitePeek)
+            result = await client(CheckChatInviteRequest(hash=invite_hash))
+
+            # Invitation is valid - now try to get the entity ID
+            entity_id = None
+            message = None
+            try:
+                entity = await client.get_entity(f'https://t.me/+{invite_hash}')
+                if hasattr(entity, 'id'):
+                    entity_id = entity.id
+                else:
+                    # Should never happen
+                    print_debug(DebugException("SHOULD NEVER HAVE HAPPENED"))
+            except ValueError as e:
+                message = str(e)
+            except FloodWaitError as e:
+                raise
+            except Exception as e:
+                print_debug(e, currentframe().f_code.co_name)
+                # Can't get entity, but invite is still valid
+                pass
+
+            # Determine reason based on result type
+            if isinstance(result, ChatInviteAlready):
+                reason = 'ALREADY_MEMBER'
+            elif isinstance(result, ChatInvite):
+                reason = 'VALID_PREVIEW'
+            elif isinstance(result, ChatInvitePeek):
+                reason = 'VALID_PEEK'
             else:
-                # Should never happen
-                print_debug(DebugException("SHOULD NEVER HAVE HAPPENED"))
-        except ValueError as e:
-            message = str(e)
-        except FloodWaitError as e:
-            raise
-        except Exception as e:
-            print_debug(e, currentframe().f_code.co_name)
-            # Can't get entity, but invite is still valid
-            pass
+                reason = 'VALID_UNKNOWN_TYPE'
 
-        # Determine reason based on result type
-        if isinstance(result, ChatInviteAlready):
-            reason = 'ALREADY_MEMBER'
-        elif isinstance(result, ChatInvite):
-            reason = 'VALID_PREVIEW'
-        elif isinstance(result, ChatInvitePeek):
-            reason = 'VALID_PEEK'
-        else:
-            reason = 'VALID_UNKNOWN_TYPE'
+            return True, entity_id, reason, message
 
-        return True, entity_id, reason, message
+        except InviteHashExpiredError as e:
+            return False, None, 'EXPIRED', str(e)
+        except InviteHashInvalidError as e:
+            return False, None, 'INVALID', str(e)
 
-    except InviteHashExpiredError as e:
-        return False, None, 'EXPIRED', str(e)
-    except InviteHashInvalidError as e:
-        return False, None, 'INVALID', str(e)
+        except FloodWaitError as e:
+            wait = get_rate_limiter(client).on_flood(e.seconds)
+            await async_sleep_with_progress(wait, dest=LOG.error, emoji=EMOJI["pause"])
+            continue
 
-    except FloodWaitError as e:
-        # Handle flood wait with recursive retry
-        sleep_with_progress(e.seconds, dest=LOG.error, emoji=EMOJI["pause"])
-        return validate_invite(client, invite_hash)
+        except Exception as e:
+            print_debug(e, currentframe().f_code.co_name)
+            return False, None, 'ERROR', f'{type(e).__name__}: {str(e)}'
 
-    except Exception as e:
-        print_debug(e, currentframe().f_code.co_name)
-        return False, None, 'ERROR', f'{type(e).__name__}: {str(e)}'
+    return False, None, 'ERROR', f'FloodWaitError: still limited after {MAX_CHECK_RETRIES} retries'
 
 
-def validate_handle(client, username):
+async def validate_handle(client, username):
     """
     Validates if a Telegram handle (@username) is valid and leads somewhere.
 
@@ -95,23 +100,27 @@ def validate_handle(client, username):
             - reason: 'valid', 'invalid', 'not_occupied', 'private', or 'error'
             - message: Descriptive message or None
     """
-    try:
-        entity = client.get_entity(username)
-        # If we get here, the handle is valid and accessible
-        return True, entity.id, 'valid', None
-    except ValueError as e:
-        return False, None, 'NO_USER', str(e)
-    except UsernameNotOccupiedError:
-        return False, None, 'not_occupied', 'Username not occupied'
-    except UsernameInvalidError:
-        return False, None, 'invalid', 'Invalid username format'
-    except ChannelPrivateError:
-        # Handle exists but is private/requires membership
-        return True, None, 'private', 'Channel/group is private'
-    except FloodWaitError as e:
-        # Handle flood wait with recursive retry
-        sleep_with_progress(e.seconds, dest=LOG.error, emoji=EMOJI["pause"], padding=2)
-        return validate_handle(client, username)
-    except Exception as e:
-        print_debug(e, currentframe().f_code.co_name)
-        return False, None, 'ERROR', f'{type(e).__name__}: {str(e)}'
+    # Retried in a loop after each FloodWait (up to MAX_CHECK_RETRIES times)
+    for _ in range(MAX_CHECK_RETRIES):
+        try:
+            entity = await client.get_entity(username)
+            # If we get here, the handle is valid and accessible
+            return True, entity.id, 'valid', None
+        except ValueError as e:
+            return False, None, 'NO_USER', str(e)
+        except UsernameNotOccupiedError:
+            return False, None, 'not_occupied', 'Username not occupied'
+        except UsernameInvalidError:
+            return False, None, 'invalid', 'Invalid username format'
+        except ChannelPrivateError:
+            # Handle exists but is private/requires membership
+            return True, None, 'private', 'Channel/group is private'
+        except FloodWaitError as e:
+            wait = get_rate_limiter(client).on_flood(e.seconds)
+            await async_sleep_with_progress(wait, dest=LOG.error, emoji=EMOJI["pause"], padding=2)
+            continue
+        except Exception as e:
+            print_debug(e, currentframe().f_code.co_name)
+            return False, None, 'ERROR', f'{type(e).__name__}: {str(e)}'
+
+    return False, None, 'ERROR', f'FloodWaitError: still limited after {MAX_CHECK_RETRIES} retries'
@@ -1,11 +1,14 @@
+import os
 import sys
 import time
+import asyncio
 from typing import Callable
 from inspect import currentframe
+from pathlib import Path
 from datetime import datetime, timedelta
 from telegram_checker.utils.exceptions import DebugException
 from telegram_checker.config.api import SLEEP_BETWEEN_CHECKS
-from telegram_checker.config.constants import EMOJI
+from telegram_checker.config.constants import EMOJI, REGEX_TIME_EXPRESSION, REGEX_TIME_OPERATOR
 from telegram_checker.utils.logger import get_logger
 
 LOG = get_logger()
@@ -19,7 +22,11 @@ def seconds_to_time(seconds):
     return " ".join(f"{v} {u}" for v, u in zip((d, h, m, s), ("d", "h", "min", "s")) if v)
 
 
-def sleep_with_progress(seconds: int, dest: Callable[[str], None] = print, emoji='', padding=0) -> None:
+def _iter_sleep_progress(seconds: int, dest: Callable[[str], None] = print, emoji='', padding=0):
+    """
+    Displays the FloodWait progress bar and yields how long to sleep before the next refresh.
+    Shared by sleep_with_progress() and async_sleep_with_progress().
+    """
     now = datetime.now()
     resume_at = now + timedelta(seconds=seconds)
 
@@ -47,12 +54,23 @@ def sleep_with_progress(seconds: int, dest: Callable[[str], None] = print, emoji
         if remaining <= 0:
             break
 
-        time.sleep(min(SLEEP_BETWEEN_CHECKS, remaining))
+        yield min(SLEEP_BETWEEN_CHECKS, remaining)
 
     sys.stdout.write(f"\r{line_width * ' '}\r")
     sys.stdout.flush()
 
 
+def sleep_with_progress(seconds: int, dest: Callable[[str], None] = print, emoji='', padding=0) -> None:
+    for delay in _iter_sleep_progress(seconds, dest, emoji, padding):
+        time.sleep(delay)
+
+
+async def async_sleep_with_progress(seconds: int, dest: Callable[[str], None] = print, emoji='', padding=0) -> None:
+    """Same as sleep_with_progress(), without blocking the event loop."""
+    for delay in _iter_sleep_progress(seconds, dest, emoji, padding):
+        await asyncio.sleep(delay)
+
+
 def get_date_time(get_date=True, get_time=True):
     dt_format = ('%Y-%m-%d' if get_date else '') + (' %H:%M' if get_time else '')
     return datetime.now().strftime(dt_format).strip()
@@ -65,7 +83,7 @@ def cut_text(text, limit=120):
 
 
 def format_console(el):
-    if not isinstance(el, str):
+    if not isinstance(el, str) or '\\' not in el:
         return el
     el = el.replace('\\[[', '').replace('\\]]', '')
     el = el.replace('\\[', '[').replace('\\]', ']')
@@ -73,7 +91,7 @@ def format_console(el):
 
 
 def format_file(el):
-    if not isinstance(el, str):
+    if not isinstance(el, str) or '\\' not in el:
         return el
     return el.replace('\\[[', '[[').replace('\\]]', ']]')
 
@@ -100,27 +118,60 @@ def print_debug(e: Exception, source=None):
     LOG.debug(str(e))
 
 
+def list_md_files(path):
+    """
+    Lists the .md files of a directory (not recursive), with a single os.scandir() pass:
+    file types come from the directory entries, without a stat() per file.
+
+    Args:
+        path (Path): Directory
+
+    Returns:
+        list[Path]: Markdown files
+    """
+    with os.scandir(path) as entries:
+        return [Path(entry.path) for entry in entries if entry.name.endswith('.md') and entry.is_file()]
+
+
 def parse_time_expression(expr):
     """
-    Parses a time expression that can be either a number or a Python expression.
+    Parses a time expression that can be either a number or a simple arithmetic expression.
 
     Args:
-        expr (str): Time expression (e.g., "86400" or "24*60*60")
+        expr (str): Time expression (e.g., "86400", "24*60*60" or "2*24*60*60 + 12*60*60")
 
     Returns:
-        int: Number of seconds
+        int: Number of seconds (positive)
 
     Raises:
-        ValueError: If the expression is invalid
+        ValueError: If the expression is invalid (only numbers, '*', '+' and '-' are allowed), or not positive
     """
-    try:
-        # Try to evaluate as a Python expression (allows "24*60*60")
-        result = eval(expr, {"__builtins__": {}}, {})
-        if not isinstance(result, (int, float)):
-            raise ValueError("Expression must evaluate to a number")
-        return int(result)
-    except Exception as e:
-        raise ValueError(f"Invalid time expression '{expr}': {e}")
+    compact = ''.join(str(expr).split())
+    # Plain number of seconds (the usual case)
+    if compact.isascii() and compact.isdigit():
+        total = int(compact)
+        if total <= 0:
+            raise ValueError(f"Invalid time expression '{expr}': must be a positive number of seconds")
+        return total
+    if not REGEX_TIME_EXPRESSION.fullmatch(compact):
+        raise ValueError(f"Invalid time expression '{expr}': only numbers, '*', '+' and '-' are allowed")
+
+    # '*' first, then '+' and '-' from left to right
+    total = 0
+    sign = 1
+    for token in REGEX_TIME_OPERATOR.split(compact):
+        if token == '+':
+            sign = 1
+        elif token == '-':
+            sign = -1
+        else:
+            product = 1
+            for factor in token.split('*'):
+                product *= float(factor) if '.' in factor else int(factor)
+            total += sign * product
+    if int(total) <= 0:
+        raise ValueError(f"Invalid time expression '{expr}': must be a positive number of seconds (got {int(total)})")
+    return int(total)
 
 
 def get_text_preview(text:str, initial_indent:int=0, initial_padding:int=0, padding:int=0, multiline:bool=False, max_lines=None, line_limit=120) -> str:
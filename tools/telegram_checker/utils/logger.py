@@ -4,11 +4,14 @@ Logging system with multiple levels and file outputs
 """
 
 import sys
+import atexit
 import builtins
+from queue import SimpleQueue
+from threading import Thread
 from time import sleep
 from enum import Enum
 from random import choice
-from telegram_checker.config.constants import EMOJI, THROTTLE_TIME
+from telegram_checker.config.constants import EMOJI, THROTTLE_TIME, THROTTLE_MAX_BACKLOG, LOG_FILE_BUFFER_SIZE
 
 
 class LogLevel(Enum):
@@ -38,6 +41,8 @@ class Logger:
             self.error_file = None
             self.output_file = None
             self._progress = None
+            self._queue = None
+            self._writer = None
             self.throttle = None
 
     def update_settings(self, debug=None, quiet=None, throttle=None):
@@ -71,9 +76,36 @@ class Logger:
         else:
             builtins.print(msg, file=sys.stderr, end=end, flush=flush)
 
+    def start_writer(self):
+        """
+        Hands the writes over to a background thread, until stop_writer():
+        callers (e.g. concurrent checks) don't wait for the output, nor for its throttle.
+        """
+        if self._queue is not None:
+            return
+        self._queue = SimpleQueue()
+        self._writer = Thread(target=self._drain, args=(self._queue,), daemon=True)
+        self._writer.start()
+
+    def stop_writer(self):
+        """Writes what is left in the background writer's queue, and writes directly again."""
+        if self._queue is None:
+            return
+        queue, self._queue = self._queue, None
+        queue.put(None)
+        self._writer.join()
+        self._writer = None
+
+    def _drain(self, queue):
+        while (item := queue.get()) is not None:
+            message, level, emoji, padding, end, flush, no_throttle = item
+            # Throttle only while the output keeps up
+            self._write(message, level, emoji, padding, end, flush, no_throttle or queue.qsize() > THROTTLE_MAX_BACKLOG)
+
     def open_files(self, log_path=None, error_path=None, output_path=None):
         """
-        Open log files for writing
+        Open log files for writing.
+        Files are block-buffered, and flushed when closed (at the latest on exit).
 
         Args:
             log_path: Path for complete log file
@@ -85,11 +117,12 @@ class Logger:
         """
         try:
             if log_path:
-                self.log_file = open(log_path, 'w', encoding='UTF-8')
+                self.log_file = open(log_path, 'w', encoding='UTF-8', buffering=LOG_FILE_BUFFER_SIZE)
             if error_path:
-                self.error_file = open(error_path, 'w', encoding='UTF-8')
+                self.error_file = open(error_path, 'w', encoding='UTF-8', buffering=LOG_FILE_BUFFER_SIZE)
             if output_path:
-                self.output_file = open(output_path, 'w', encoding='UTF-8')
+                self.output_file = open(output_path, 'w', encoding='UTF-8', buffering=LOG_FILE_BUFFER_SIZE)
+            atexit.register(self.close_files)
             return True
         except Exception as e:
             builtins.print(f"Failed to open log files: {e}", file=sys.stderr)
@@ -110,7 +143,8 @@ class Logger:
     @staticmethod
     def _format_console(text):
         """Remove Obsidian escapes for console"""
-        if not isinstance(text, str):
+        # Most messages have no escapes: a single scan instead of four replace() passes
+        if not isinstance(text, str) or '\\' not in text:
             return text
         text = text.replace('\\[[', '').replace('\\]]', '')
         text = text.replace('\\[', '[').replace('\\]', ']')
@@ -119,12 +153,21 @@ class Logger:
     @staticmethod
     def _format_file(text):
         """Keep Obsidian links for file"""
-        if not isinstance(text, str):
+        if not isinstance(text, str) or '\\' not in text:
             return text
         return text.replace('\\[[', '[[').replace('\\]]', ']]')
 
     def log(self, message, level:LogLevel=LogLevel.INFO, emoji='', padding=0, end='\n', flush=True, no_throttle=False):
         """Generic log method"""
+        # Fast path: debug messages are dropped without being formatted, queued, or throttled
+        if level == LogLevel.DEBUG and not self.debug_mode:
+            return
+        if self._queue is not None:
+            self._queue.put((message, level, emoji, padding, end, flush, no_throttle))
+        else:
+            self._write(message, level, emoji, padding, end, flush, no_throttle)
+
+    def _write(self, message, level, emoji, padding, end, flush, no_throttle):
         if self.throttle and not no_throttle:
             sleep(THROTTLE_TIME)
 
@@ -138,29 +181,29 @@ class Logger:
         if level == LogLevel.ERROR:
             self._print_stderr(console_msg, end=end, flush=flush)
             if self.log_file:
-                builtins.print(file_msg, file=self.log_file, end=end, flush=flush)
+                builtins.print(file_msg, file=self.log_file, end=end)
             if self.error_file:
-                builtins.print(file_msg, file=self.error_file, end=end, flush=flush)
+                builtins.print(file_msg, file=self.error_file, end=end)
 
         elif level == LogLevel.INFO:
             self._print_stdout(console_msg, end=end, flush=flush)
             if self.log_file:
-                builtins.print(file_msg, file=self.log_file, end=end, flush=flush)
+                builtins.print(file_msg, file=self.log_file, end=end)
 
         elif level == LogLevel.OUTPUT:
             if not self.quiet_mode:
                 self._print_stdout(console_msg, end=end, flush=flush)
             if self.log_file:
-                builtins.print(file_msg, file=self.log_file, end=end, flush=flush)
+                builtins.print(file_msg, file=self.log_file, end=end)
             if self.output_file:
-                builtins.print(file_msg, file=self.output_file, end=end, flush=flush)
+                builtins.print(file_msg, file=self.output_file, end=end)
 
         elif level == LogLevel.DEBUG:
             # DEBUG does not use emoji and padding
             if self.debug_mode:
                 self._print_stderr(console_msg, end=end, flush=flush)
                 if self.log_file:
-                    builtins.print(file_msg, file=self.log_file, end=end, flush=flush)
+                    builtins.print(file_msg, file=self.log_file, end=end)
 
     def error(self, message = "", emoji='', padding=0, end='\n', flush=True, no_throttle=False):
         """Log error message"""
@@ -179,6 +222,34 @@ class Logger:
         self.log(message, LogLevel.DEBUG, emoji=choice(EMOJI["list_bugs"]), padding=padding, end=end, flush=flush, no_throttle=no_throttle)
 
 
+class LogBuffer:
+    """
+    Records log calls instead of writing them, until replay().
+    Lets a worker thread prepare output that is written, in order, by the code that owns the console.
+    """
+
+    def __init__(self):
+        self.records = []
+
+    def error(self, *args, **kwargs):
+        self.records.append((Logger.error, args, kwargs))
+
+    def info(self, *args, **kwargs):
+        self.records.append((Logger.info, args, kwargs))
+
+    def output(self, *args, **kwargs):
+        self.records.append((Logger.output, args, kwargs))
+
+    def debug(self, *args, **kwargs):
+        self.records.append((Logger.debug, args, kwargs))
+
+    def replay(self, log):
+        """Writes the recorded calls to `log` (a Logger), and forgets them."""
+        records, self.records = self.records, []
+        for method, args, kwargs in records:
+            method(log, *args, **kwargs)
+
+
 # Global singleton instance
 _logger_instance = None
 
@@ -1,33 +1,62 @@
+import json
+from collections import Counter
 from telegram_checker.config.constants import (
-    EMOJI,
-    UI_HORIZONTAL_LINE
+    UI_HORIZONTAL_LINE,
+    EMOJI_ACTIVE,
+    EMOJI_BANNED,
+    EMOJI_DELETED,
+    EMOJI_ID_MISMATCH,
+    EMOJI_UNKNOWN,
+    EMOJI_ERROR,
+    EMOJI_SKIP,
+    EMOJI_ID,
+    EMOJI_IGNORED,
+    EMOJI_DRY_RUN,
+    EMOJI_HANDLE,
+    EMOJI_STATS,
+    EMOJI_WARNING,
+    EMOJI_INFO,
+    EMOJI_METHODS,
+    EMOJI_CHANGE,
 )
 from telegram_checker.utils.helpers import get_date_time
 from telegram_checker.utils.logger import get_logger
 LOG = get_logger()
 
 
-def print_dry_run_summary(results):
+def _iter_results(results_path):
+    with open(results_path, 'r', encoding='utf-8') as f:
+        for line in f:
+            yield json.loads(line)
+
+
+def print_dry_run_summary(results_path):
     """
     Prints a summary of what would be changed in dry-run mode.
+    Results are streamed from the file, one pass per group, instead of being kept in memory.
 
     Args:
-        results (list): List of result dictionaries
+        results_path (Path): JSONL file of result dictionaries
     """
-    if not results:
+    try:
+        counts = Counter(r['status'] for r in _iter_results(results_path))
+    except OSError:
+        return
+    if not counts:
         return
 
     # Note: print_dry_run_summary uses INFO log level instead of OUTPUT
 
     LOG.info("\n" + UI_HORIZONTAL_LINE)
-    LOG.info("DRY-RUN SUMMARY - Changes to apply:", EMOJI["dry-run"])
+    LOG.info("DRY-RUN SUMMARY - Changes to apply:", EMOJI_DRY_RUN)
 
     # Group by status
-    for status_type in ['active', 'banned', 'deleted', 'unknown']:
-        filtered = [r for r in results if r['status'] == status_type]
-        if filtered:
-            LOG.info(f"\n{filtered[0]['emoji']} {status_type.upper()} ({len(filtered)}):")
-            for r in filtered:
+    for status_type, emoji in (('active', EMOJI_ACTIVE), ('banned', EMOJI_BANNED), ('deleted', EMOJI_DELETED), ('unknown', EMOJI_UNKNOWN)):
+        if counts[status_type]:
+            LOG.info(f"\n{emoji} {status_type.upper()} ({counts[status_type]}):")
+            for r in _iter_results(results_path):
+                if r['status'] != status_type:
+                    continue
                 LOG.info(f"  • {r['file']}: {r['identifier']}")
                 LOG.info(f"    → - `{r['status']}`, `{r['timestamp']}`")
                 if r.get('restriction_details'):
@@ -39,14 +68,16 @@ def print_dry_run_summary(results):
                         LOG.info(f"- text: `{text}`", padding=6)
 
     # Errors
-    errors = [r for r in results if r['status'].startswith('error_')]
-    if errors:
+    error_count = sum(count for status, count in counts.items() if status.startswith('error_'))
+    if error_count:
         LOG.info()
-        LOG.info(f"ERRORS ({len(errors)}):", EMOJI["error"])
-        for r in errors:
+        LOG.info(f"ERRORS ({error_count}):", EMOJI_ERROR)
+        for r in _iter_results(results_path):
+            if not r['status'].startswith('error_'):
+                continue
             LOG.info(f"  • {r['file']}: {r['identifier']} → {r['status']}")
 
-    LOG.info("To apply these changes, run again without --dry-run", EMOJI["info"])
+    LOG.info("To apply these changes, run again without --dry-run", EMOJI_INFO)
     LOG.info(UI_HORIZONTAL_LINE)
 
 
@@ -55,57 +86,62 @@ def print_dry_run_summary(results):
 # ============================================
 
 def print_stats(stats):
-    LOG.output("\n" + UI_HORIZONTAL_LINE)
-    LOG.output("RESULTS", EMOJI["stats"])
-    LOG.output()
-    LOG.output(f"Total checked:  {stats['total']}")
-    LOG.output(f"{EMOJI.get("active")     } Active:      {stats['active']     }")
-    LOG.output(f"{EMOJI.get("banned")     } Banned:      {stats['banned']     }")
-    LOG.output(f"{EMOJI.get("deleted")    } Deleted:     {stats['deleted']    }")
-    LOG.output(f"{EMOJI.get("id_mismatch")} ID Mismatch: {stats['id_mismatch']}")
-    LOG.output(f"{EMOJI.get("unknown")    } Unknown:     {stats['unknown']    }")
-    LOG.output(f"{EMOJI.get("error")      } Errors:      {stats['error']      }")
-    LOG.output()
-    LOG.output(f"Skipped (total):      {stats['skipped']}", EMOJI["skip"])
+    # Built as a single block: one write (and one throttle) instead of one per line
+    method = stats['method']
+    lines = [
+        "\n" + UI_HORIZONTAL_LINE,
+        f"{EMOJI_STATS} RESULTS",
+        "",
+        f"Total checked:  {stats['total']}",
+        f"{EMOJI_ACTIVE     } Active:      {stats['active']     }",
+        f"{EMOJI_BANNED     } Banned:      {stats['banned']     }",
+        f"{EMOJI_DELETED    } Deleted:     {stats['deleted']    }",
+        f"{EMOJI_ID_MISMATCH} ID Mismatch: {stats['id_mismatch']}",
+        f"{EMOJI_UNKNOWN    } Unknown:     {stats['unknown']    }",
+        f"{EMOJI_ERROR      } Errors:      {stats['error']      }",
+        "",
+        f"{EMOJI_SKIP} Skipped (total):      {stats['skipped']}",
+    ]
     if stats['skipped_user'] > 0:
-        LOG.output(f"   └─ User interruption: {stats['skipped_user']}")
+        lines.append(f"   └─ User interruption: {stats['skipped_user']}")
     if stats['skipped_time'] > 0:
-        LOG.output(f"   └─ Recently checked:  {stats['skipped_time']}")
+        lines.append(f"   └─ Recently checked:  {stats['skipped_time']}")
     if stats['skipped_status'] > 0:
-        LOG.output(f"   └─ By status:         {stats['skipped_status']}")
+        lines.append(f"   └─ By status:         {stats['skipped_status']}")
     if stats['skipped_no_identifier'] > 0:
-        LOG.output(f"   └─ No identifier:     {stats['skipped_no_identifier']}")
+        lines.append(f"   └─ No identifier:     {stats['skipped_no_identifier']}")
     if stats['skipped_type'] > 0:
-        LOG.output(f"   └─ Wrong type:        {stats['skipped_type']}")
+        lines.append(f"   └─ Wrong type:        {stats['skipped_type']}")
     if stats['ignored'] > 0:
-        LOG.output()
-        LOG.output(f"total:      {stats['ignored']}", EMOJI["ignored"])
-    LOG.output()
-    if stats['method']:
-        LOG.output("Methods used:", EMOJI["methods"])
-        if stats['method']['id'] > 0:
-            LOG.output(f"   └─ By ID:        {stats['method']['id']}")
-        if stats['method']['username'] > 0:
-            LOG.output(f"   └─ By username:  {stats['method']['username']}")
-        if stats['method']['invite'] > 0:
-            LOG.output(f"   └─ By invite:    {stats['method']['invite']}")
-    LOG.output(UI_HORIZONTAL_LINE)
+        lines.append("")
+        lines.append(f"{EMOJI_IGNORED} total:      {stats['ignored']}")
+    lines.append("")
+    if method:
+        lines.append(f"{EMOJI_METHODS} Methods used:")
+        if method['id'] > 0:
+            lines.append(f"   └─ By ID:        {method['id']}")
+        if method['username'] > 0:
+            lines.append(f"   └─ By username:  {method['username']}")
+        if method['invite'] > 0:
+            lines.append(f"   └─ By invite:    {method['invite']}")
+        if method['cache'] > 0:
+            lines.append(f"   └─ From cache:   {method['cache']}")
+    lines.append(UI_HORIZONTAL_LINE)
+    LOG.output("\n".join(lines))
 
 
 def print_no_status_block(no_status_block_results):
-    LOG.output(UI_HORIZONTAL_LINE)
-    LOG.output("Files without 'status:' block, but status detected", EMOJI["warning"])
-    for item in no_status_block_results:
-        LOG.output(f"• \\[[{item['file']}\\]] → {item['emoji']} {item['status']}")
-    LOG.output(UI_HORIZONTAL_LINE)
+    lines = [UI_HORIZONTAL_LINE, f"{EMOJI_WARNING} Files without 'status:' block, but status detected"]
+    lines += [f"• \\[[{item['file']}\\]] → {item['emoji']} {item['status']}" for item in no_status_block_results]
+    lines.append(UI_HORIZONTAL_LINE)
+    LOG.output("\n".join(lines))
 
 
 def print_status_changed_files(status_changed_files):
-    LOG.output("\n" + "!" * 60)
-    LOG.output("Files with status change. Rename file in Obsidian", EMOJI["change"])
-    for item in status_changed_files:
-        LOG.output(f"• \\[[{item['file']}\\]] : {item['old']} → {item['new']}")
-    LOG.output(UI_HORIZONTAL_LINE)
+    lines = ["\n" + "!" * 60, f"{EMOJI_CHANGE} Files with status change. Rename file in Obsidian"]
+    lines += [f"• \\[[{item['file']}\\]] : {item['old']} → {item['new']}" for item in status_changed_files]
+    lines.append(UI_HORIZONTAL_LINE)
+    LOG.output("\n".join(lines))
 
 
 def print_recovered_ids(recovered_ids):
@@ -118,37 +154,37 @@ def print_recovered_ids(recovered_ids):
     if not recovered_ids:
         return
 
-    LOG.output("\n" + UI_HORIZONTAL_LINE)
-    LOG.output(f"{EMOJI['id']} RECOVERED IDs ({len(recovered_ids)})")
+    lines = ["\n" + UI_HORIZONTAL_LINE, f"{EMOJI_ID} RECOVERED IDs ({len(recovered_ids)})"]
 
     # Group by method
     by_invite = [r for r in recovered_ids if r['method'] == 'invite']
     by_username = [r for r in recovered_ids if r['method'] == 'username']
 
     if by_invite:
-        LOG.output(f"\n✅ Via INVITE (reliable):")
+        lines.append(f"\n✅ Via INVITE (reliable):")
         for item in by_invite:
             written_mark = "✅" if item.get('written') else "⚠️"
-            LOG.output(f"  {written_mark} \\[[{item['file']}\\]] → id: `{item['id']}`")
+            lines.append(f"  {written_mark} \\[[{item['file']}\\]] → id: `{item['id']}`")
 
         written_count = sum(1 for r in by_invite if r.get('written'))
         if written_count > 0:
-            LOG.output(f"\n  ✅ {written_count} ID(s) written to files")
+            lines.append(f"\n  ✅ {written_count} ID(s) written to files")
         not_written = len(by_invite) - written_count
         if not_written > 0:
-            LOG.output(f"  ⚠️  {not_written} ID(s) not written (ID already exists or --write-id not enabled)")
+            lines.append(f"  ⚠️  {not_written} ID(s) not written (ID already exists or --write-id not enabled)")
 
     if by_username:
-        LOG.output(f"\n⚠️  Via USERNAME (unreliable - DO NOT write):")
+        lines.append(f"\n⚠️  Via USERNAME (unreliable - DO NOT write):")
         for item in by_username:
-            LOG.output(f"  • \\[[{item['file']}\\]] → id: `{item['id']}`")
-        LOG.output(f"\n  ⚠️  These IDs were recovered via username.")
-        LOG.output(f"     Verify manually before adding them to files!")
+            lines.append(f"  • \\[[{item['file']}\\]] → id: `{item['id']}`")
+        lines.append(f"\n  ⚠️  These IDs were recovered via username.")
+        lines.append(f"     Verify manually before adding them to files!")
 
     if by_invite:
-        LOG.output(f"{EMOJI['info']} IDs recovered via invite are reliable and permanent.")
-        LOG.output(f"{EMOJI['info']} Use them for faster future checks.")
-    LOG.output(UI_HORIZONTAL_LINE)
+        lines.append(f"{EMOJI_INFO} IDs recovered via invite are reliable and permanent.")
+        lines.append(f"{EMOJI_INFO} Use them for faster future checks.")
+    lines.append(UI_HORIZONTAL_LINE)
+    LOG.output("\n".join(lines))
 
 
 def print_discovered_usernames(discovered_usernames):
@@ -161,28 +197,29 @@ def print_discovered_usernames(discovered_usernames):
     if not discovered_usernames:
         return
 
-    LOG.output("\n" + UI_HORIZONTAL_LINE)
-    LOG.output(f"{EMOJI['handle']} DISCOVERED/CHANGED USERNAMES ({len(discovered_usernames)})")
+    lines = ["\n" + UI_HORIZONTAL_LINE, f"{EMOJI_HANDLE} DISCOVERED/CHANGED USERNAMES ({len(discovered_usernames)})"]
+    now = get_date_time()
 
     # Group by status
     discovered = [u for u in discovered_usernames if u['status'] == 'discovered']
     changed = [u for u in discovered_usernames if u['status'] == 'changed']
 
     if discovered:
-        LOG.output(f"\n✨ DISCOVERED (new usernames):")
+        lines.append(f"\n✨ DISCOVERED (new usernames):")
         for item in discovered:
-            LOG.output(f"  • \\[[{item['file']}\\]] → `@{item['new_username']}` ([link](https://t.me/{item['new_username']}), `{get_date_time()}`")
-        LOG.output(f"\n  {EMOJI["info"]}  {len(discovered)} username(s) discovered")
+            lines.append(f"  • \\[[{item['file']}\\]] → `@{item['new_username']}` ([link](https://t.me/{item['new_username']}), `{now}`")
+        lines.append(f"\n  {EMOJI_INFO}  {len(discovered)} username(s) discovered")
 
     if changed:
-        LOG.output(f"\n🔄 CHANGED (username updates):")
+        lines.append(f"\n🔄 CHANGED (username updates):")
         for item in changed:
-            LOG.output(f"  • \\[[{item['file']}\\]] : @{item['old_username']} → `@{item['new_username']}` ([link](https://t.me/{item['new_username']}), `{get_date_time()}`")
-        LOG.output(f"\n  ⚠️  {len(changed)} username(s) changed")
+            lines.append(f"  • \\[[{item['file']}\\]] : @{item['old_username']} → `@{item['new_username']}` ([link](https://t.me/{item['new_username']}), `{now}`")
+        lines.append(f"\n  ⚠️  {len(changed)} username(s) changed")
 
-    LOG.output(f"{EMOJI['warning']} Usernames can change frequently - verify before updating files!")
-    LOG.output(f"{EMOJI['info']} Consider manually updating the markdown files with new usernames.")
-    LOG.output(UI_HORIZONTAL_LINE)
+    lines.append(f"{EMOJI_WARNING} Usernames can change frequently - verify before updating files!")
+    lines.append(f"{EMOJI_INFO} Consider manually updating the markdown files with new usernames.")
+    lines.append(UI_HORIZONTAL_LINE)
+    LOG.output("\n".join(lines))
 
 
 def print_stats_report(stats):
@@ -193,54 +230,48 @@ def print_stats_report(stats):
     reported     = stats['reported_auto'] + stats['reported_manual']
     avg_reported = (reported / processed) if processed else 0
 
-    LOG.info()
-    LOG.info(UI_HORIZONTAL_LINE[:(len(UI_HORIZONTAL_LINE) // 2)])
-    LOG.info("Mass Report Statistics")
-    LOG.info(UI_HORIZONTAL_LINE[:(len(UI_HORIZONTAL_LINE) // 2)])
-    LOG.info("ENTITIES")
-    LOG.info(UI_HORIZONTAL_LINE[:(len(UI_HORIZONTAL_LINE) // 2)])
-    LOG.info(f"Processed         : {processed}")
-    LOG.info(
-        f"Skipped           : {stats['skipped']}"
-        f"\n  └─ type         : {stats['skipped_type']}"
-        f"\n  └─ last check   : {stats['skipped_time']}"
-        f"\n  └─ last report  : {stats['skipped_field']}"
-        f"\n  └─ status       : {stats['skipped_status']}"
-        f"\n  └─ no id        : {stats['skipped_no_identifier']}"
-        f"\n  └─ error        : {stats['skipped_error']}"
-        f"\n  └─ by user      : {stats['skipped_user']}"
-    )
-    LOG.info(
-        f"Errors            : {stats['errors']}"
-        f"\n  └─ Entity       : {stats['report_error_resolution']}"
-        f"\n  └─ Fetch msg    : {stats['report_error_fetch']}"
-        f"\n  └─ Filter msg   : {stats['report_error_filter']}"
-        f"\n  └─ Flood        : {stats['report_error_flood']}"
-        f"\n  └─ Report       : {stats['report_error']}"
-        f"\n  └─ LLM          : {stats['llm_error']}"
-    )
-    LOG.info()
-    LOG.info(
-        f"Analyzed          : {stats['analyzed']}"
-        f"\n  └─ avg          : {avg_analyzed:.1f}/entity"
-    )
-    LOG.info(UI_HORIZONTAL_LINE[:(len(UI_HORIZONTAL_LINE)//2)])
-    LOG.info('MESSAGES')
-    LOG.info(UI_HORIZONTAL_LINE[:(len(UI_HORIZONTAL_LINE)//2)])
-    LOG.info(
-        f"Reported          : {reported}"
-        f"\n  └─ avg          : {avg_reported:.1f}/entity"
-        f"\n  └─ auto         : {stats['reported_auto']}"
-        f"\n  └─ manual:      : {stats['reported_manual']}"
-    )
-    LOG.info(f"Ignored (user)    : {stats['skipped_manual']}")
-    LOG.info(f"Log only          : {stats['log_only']}")
-    LOG.info(f"Harmless          : {stats['harmless']}")
-    LOG.info(f"Low confidence    : {stats['low_confidence']}")
-    LOG.info(f"LLM time          : {mean(stats['llm_time']):.3} s/msg")
-
+    # Built as a single block: one write (and one throttle) instead of one per line
+    half_line = UI_HORIZONTAL_LINE[:(len(UI_HORIZONTAL_LINE) // 2)]
+    lines = [
+        "",
+        half_line,
+        "Mass Report Statistics",
+        half_line,
+        "ENTITIES",
+        half_line,
+        f"Processed         : {processed}",
+        f"Skipped           : {stats['skipped']}",
+        f"  └─ type         : {stats['skipped_type']}",
+        f"  └─ last check   : {stats['skipped_time']}",
+        f"  └─ last report  : {stats['skipped_field']}",
+        f"  └─ status       : {stats['skipped_status']}",
+        f"  └─ no id        : {stats['skipped_no_identifier']}",
+        f"  └─ error        : {stats['skipped_error']}",
+        f"  └─ by user      : {stats['skipped_user']}",
+        f"Errors            : {stats['errors']}",
+        f"  └─ Entity       : {stats['report_error_resolution']}",
+        f"  └─ Fetch msg    : {stats['report_error_fetch']}",
+        f"  └─ Filter msg   : {stats['report_error_filter']}",
+        f"  └─ Flood        : {stats['report_error_flood']}",
+        f"  └─ Report       : {stats['report_error']}",
+        f"  └─ LLM          : {stats['llm_error']}",
+        "",
+        f"Analyzed          : {stats['analyzed']}",
+        f"  └─ avg          : {avg_analyzed:.1f}/entity",
+        half_line,
+        'MESSAGES',
+        half_line,
+        f"Reported          : {reported}",
+        f"  └─ avg          : {avg_reported:.1f}/entity",
+        f"  └─ auto         : {stats['reported_auto']}",
+        f"  └─ manual:      : {stats['reported_manual']}",
+        f"Ignored (user)    : {stats['skipped_manual']}",
+        f"Log only          : {stats['log_only']}",
+        f"Harmless          : {stats['harmless']}",
+        f"Low confidence    : {stats['low_confidence']}",
+        f"LLM time          : {mean(stats['llm_time']):.3} s/msg",
+    ]
     if stats['tags']:
-        LOG.info()
-        LOG.info("Tags breakdown:")
-        for tag, count in stats['tags'].most_common():
-            LOG.info(f"  {tag:<30} {count}")
+        lines += ["", "Tags breakdown:"]
+        lines += [f"  {tag:<30} {count}" for tag, count in stats['tags'].most_common()]
+    LOG.info("\n".join(lines))